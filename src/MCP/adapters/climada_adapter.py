@@ -8,10 +8,11 @@ Handles environment activation, script execution, and result processing.
 import json
 import logging
 import tempfile
+import time
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from ..core.base_model import BaseModel, ModelResult, ModelStatus
 from ..tools.climada_tools import get_climada_tools
@@ -100,8 +101,11 @@ class ClimadaAdapter(BaseModel):
             execution_id = str(uuid.uuid4())
         
         start_time = datetime.now()
+        start_ns = time.monotonic_ns()
         self.status = ModelStatus.RUNNING
         self.current_execution_id = execution_id
+        exec_dir: Optional[Path] = None
+        output_files: List[str] = []
         
         try:
             # Validate tool exists
@@ -136,17 +140,18 @@ class ClimadaAdapter(BaseModel):
                 error = result.stderr.decode()
             
             # Create result
+            output_files = self._collect_output_files(exec_dir, {script_path.name})
             model_result = self.create_result(
                 tool_name=tool_name,
                 execution_id=execution_id,
                 status=status,
                 start_time=start_time,
-                end_time=datetime.now(),
-                duration=(datetime.now() - start_time).total_seconds(),
+                start_ns=start_ns,
                 data=execution_result,
                 error=error,
-                files=self._collect_output_files(exec_dir),
-                working_directory=str(exec_dir)
+                files=output_files,
+                # Without outputs the directory goes back to the pool below
+                working_directory=str(exec_dir) if output_files else None
             )
             
             return model_result
@@ -158,14 +163,17 @@ class ClimadaAdapter(BaseModel):
                 execution_id=execution_id,
                 status=ModelStatus.FAILED,
                 start_time=start_time,
-                end_time=datetime.now(),
-                duration=(datetime.now() - start_time).total_seconds(),
+                start_ns=start_ns,
                 error=str(e)
             )
         
         finally:
             self.status = ModelStatus.IDLE
             self.current_execution_id = None
+            # A directory holding returned output files belongs to the caller;
+            # anything else is recycled
+            if exec_dir is not None and not output_files:
+                await self.cleanup_execution_environment(exec_dir)
     
     def _generate_script(self, tool_name: str, parameters: Dict[str, Any]) -> str:
         """Generate Python script for tool execution."""
@@ -515,10 +523,17 @@ print("Uncertainty analysis completed")
             self.logger.warning(f"Could not parse results: {e}")
             return {"stdout": stdout_content}
     
-    def _collect_output_files(self, exec_dir: Path) -> List[str]:
-        """Collect output files from execution directory."""
+    def _collect_output_files(self, exec_dir: Path, internal: Set[str]) -> List[str]:
+        """
+        Collect output files from execution directory.
+        
+        ``internal`` names the files the adapter wrote itself; they and the
+        parsed ``results.json`` are not outputs.
+        """
         output_files = []
         for file_path in exec_dir.glob("*"):
+            if file_path.name in internal or file_path.name == "results.json":
+                continue
             if file_path.is_file() and file_path.suffix in ['.h5', '.nc', '.csv', '.json', '.png']:
                 output_files.append(str(file_path))
         return output_files
\ No newline at end of file
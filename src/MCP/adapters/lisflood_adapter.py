@@ -8,11 +8,12 @@ Handles environment activation, script execution, and result processing.
 import json
 import logging
 import tempfile
+import time
 import uuid
 import xml.etree.ElementTree as ET
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from ..core.base_model import BaseModel, ModelResult, ModelStatus
 from ..tools.lisflood_tools import get_lisflood_tools
@@ -102,8 +103,11 @@ class LisfloodAdapter(BaseModel):
             execution_id = str(uuid.uuid4())
         
         start_time = datetime.now()
+        start_ns = time.monotonic_ns()
         self.status = ModelStatus.RUNNING
         self.current_execution_id = execution_id
+        exec_dir: Optional[Path] = None
+        output_files: List[str] = []
         
         try:
             # Validate tool exists
@@ -144,17 +148,18 @@ class LisfloodAdapter(BaseModel):
                 error = result.stderr.decode()
             
             # Create result
+            output_files = self._collect_output_files(exec_dir, {script_path.name, config_path.name})
             model_result = self.create_result(
                 tool_name=tool_name,
                 execution_id=execution_id,
                 status=status,
                 start_time=start_time,
-                end_time=datetime.now(),
-                duration=(datetime.now() - start_time).total_seconds(),
+                start_ns=start_ns,
                 data=execution_result,
                 error=error,
-                files=self._collect_output_files(exec_dir),
-                working_directory=str(exec_dir)
+                files=output_files,
+                # Without outputs the directory goes back to the pool below
+                working_directory=str(exec_dir) if output_files else None
             )
             
             return model_result
@@ -166,14 +171,17 @@ class LisfloodAdapter(BaseModel):
                 execution_id=execution_id,
                 status=ModelStatus.FAILED,
                 start_time=start_time,
-                end_time=datetime.now(),
-                duration=(datetime.now() - start_time).total_seconds(),
+                start_ns=start_ns,
                 error=str(e)
             )
         
         finally:
             self.status = ModelStatus.IDLE
             self.current_execution_id = None
+            # A directory holding returned output files belongs to the caller;
+            # anything else is recycled
+            if exec_dir is not None and not output_files:
+                await self.cleanup_execution_environment(exec_dir)
     
     def _generate_config(self, tool_name: str, parameters: Dict[str, Any]) -> str:
         """Generate Lisflood XML configuration file."""
@@ -552,10 +560,17 @@ print("Model calibration completed")
             self.logger.warning(f"Could not parse results: {e}")
             return {"stdout": stdout_content}
     
-    def _collect_output_files(self, exec_dir: Path) -> List[str]:
-        """Collect output files from execution directory."""
+    def _collect_output_files(self, exec_dir: Path, internal: Set[str]) -> List[str]:
+        """
+        Collect output files from execution directory.
+        
+        ``internal`` names the files the adapter wrote itself; they and the
+        parsed ``results.json`` are not outputs.
+        """
         output_files = []
         for file_path in exec_dir.glob("*"):
+            if file_path.name in internal or file_path.name == "results.json":
+                continue
             if file_path.is_file() and file_path.suffix in ['.nc', '.tss', '.csv', '.json', '.xml']:
                 output_files.append(str(file_path))
         return output_files
\ No newline at end of file
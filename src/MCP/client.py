@@ -24,6 +24,9 @@ class MCPClient:
     Connects to deployed models via SSH and Docker containers.
     """
     
+    # Connections pinged more recently than this are reused without a remote probe
+    CONNECTION_TTL_NS = 30 * 1_000_000_000
+    
     def __init__(self):
         # Remote host configuration
         self.remote_host = "lenovo@10.0.3.4"  # TiaozhanbeiMCP host
@@ -42,11 +45,13 @@ class MCPClient:
         
         # Docker container info (shared container for multiple models)
         self.docker_container_id = None  # Will be determined at runtime
+        self._container_id_lock = asyncio.Lock()
         
         # Jupyter Lab info for Climada/Lisflood/Aurora
         self.jupyter_base_url = "http://10.0.3.4:8888"
         
         self.active_connections = {}
+        self._tools_dict_cache: Dict[Optional[str], tuple[int, List[Dict[str, Any]]]] = {}
         # self._sdk_client = None # ļƺûбʹãƳ
         self._ssh_client = None # ʼΪ None
     
@@ -78,7 +83,15 @@ class MCPClient:
         """Get the Docker container ID for models that use containers."""
         if self.docker_container_id:
             return self.docker_container_id
-            
+        
+        # Only one coroutine probes the host; concurrent callers reuse its result
+        async with self._container_id_lock:
+            if self.docker_container_id:
+                return self.docker_container_id
+            return await self._probe_docker_container_id()
+    
+    async def _probe_docker_container_id(self) -> Optional[str]:
+        """Look up the shared model container over SSH and cache its ID."""
         try:
             ssh = await self._get_ssh_connection()
             # *** ؼ޸ģʹ첽 SSH ִ ***
@@ -94,7 +107,19 @@ class MCPClient:
         return None
     
     async def connect_to_model(self, model_name: str) -> bool:
-        """Connect to a specific model server."""
+        """Connect to a specific model server.
+
+        A connection pinged within ``CONNECTION_TTL_NS`` is trusted without
+        probing the remote host again; ``disconnect_from_model`` invalidates it.
+        """
+        connection = self.active_connections.get(model_name)
+        if (
+            connection
+            and connection["connected"]
+            and time.monotonic_ns() - connection["last_ping_ns"] < self.CONNECTION_TTL_NS
+        ):
+            return True
+        
         try:
             model_key = self.model_endpoints.get(model_name)
             if not model_key:
@@ -131,7 +156,7 @@ class MCPClient:
                 self.active_connections[model_name] = {
                     "endpoint": model_key,
                     "connected": True,
-                    "last_ping": datetime.now()
+                    "last_ping_ns": time.monotonic_ns()
                 }
                 return True
             else:
@@ -162,11 +187,22 @@ class MCPClient:
             return None
     
     async def list_available_tools(self, model_name: Optional[str] = None) -> List[Dict[str, Any]]:
-        """List available tools, optionally filtered by model."""
+        """List available tools, optionally filtered by model.
+
+        Serialized tool lists are cached per model and rebuilt only when the
+        registry version changes.
+        """
+        version = tool_registry.version
+        cached = self._tools_dict_cache.get(model_name)
+        if cached and cached[0] == version:
+            return cached[1]
+        
         try:
             # tool_registry ͬģڲкʱҲҪװ
             tools = await asyncio.to_thread(tool_registry.list_tools, model_name=model_name)
-            return [tool.to_dict() for tool in tools]
+            tool_dicts = [tool.to_dict() for tool in tools]
+            self._tools_dict_cache[model_name] = (version, tool_dicts)
+            return tool_dicts
         except Exception as e:
             print(f"Failed to list tools: {e}")
             return []
@@ -199,7 +235,7 @@ class MCPClient:
     ) -> Dict[str, Any]:
         """Call Pangu Weather forecasting model via Docker container."""
         
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
             container_id = await self._get_docker_container_id()
@@ -243,7 +279,7 @@ class MCPClient:
                 # and extract temperature, humidity, wind, pressure data
             }
             
-            processing_time = time.time() - start_time
+            processing_time = time.monotonic() - start_time
             
             return {
                 "model": "pangu_weather",
@@ -257,7 +293,7 @@ class MCPClient:
             return {
                 "model": "pangu_weather",
                 "error": str(e),
-                "processing_time": time.time() - start_time,
+                "processing_time": time.monotonic() - start_time,
                 "note": "Requires SSH connection and input data preparation"
             }
     
@@ -371,11 +407,16 @@ result
         location: "Location", #  Location һѶ
         weather_data: Dict[str, Any],
         fuel_data: Dict[str, Any],
-        ignition_points: List[Dict[str, float]]
+        ignition_points: List[Dict[str, float]],
+        echo_inputs: bool = False
     ) -> Dict[str, Any]: #  ModelResult һ Dict[str, Any]
-        """Call Cell2Fire wildfire simulation model via Docker container."""
+        """Call Cell2Fire wildfire simulation model via Docker container.
+
+        Input dictionaries are only echoed back in ``prediction`` when
+        ``echo_inputs`` is set, since they can be large for big simulations.
+        """
         
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
             container_id = await self._get_docker_container_id()
@@ -402,18 +443,21 @@ result
                 "fire_simulation": "completed",
                 "output_path": "/Cell2Fire/results",
                 "execution_output": output.strip(),
-                "location": location.to_dict(),
-                "weather_data": weather_data,
-                "fuel_data": fuel_data,
-                "ignition_points": ignition_points
+                "location": location.to_dict()
             }
-            
-            processing_time = time.time() - start_time
+            if echo_inputs:
+                prediction.update({
+                    "weather_data": weather_data,
+                    "fuel_data": fuel_data,
+                    "ignition_points": ignition_points
+                })
+            
+            processing_time = time.monotonic() - start_time
             confidence = 0.85
             
         except Exception as e:
             prediction = {"error": str(e), "status": "failed"}
-            processing_time = time.time() - start_time
+            processing_time = time.monotonic() - start_time
             confidence = 0.0
         
         return {
@@ -428,9 +472,13 @@ result
     async def call_nfdrs4_model(
         self,
         weather_data: Dict[str, Any],
-        fuel_moisture_data: Dict[str, Any]
+        fuel_moisture_data: Dict[str, Any],
+        echo_inputs: bool = False
     ) -> Dict[str, Any]:
-        """Call NFDRS4 fire danger rating model via Docker container."""
+        """Call NFDRS4 fire danger rating model via Docker container.
+
+        Input dictionaries are only echoed back when ``echo_inputs`` is set.
+        """
         try:
             container_id = await self._get_docker_container_id()
             if not container_id:
@@ -450,13 +498,15 @@ result
             if error and "Warning" not in error:
                 raise Exception(f"NFDRS4 execution error: {error}")
             
-            return {
+            result = {
                 "model": "nfdrs4",
                 "fire_danger_rating": "calculated",
-                "output": output.strip(),
-                "weather_data": weather_data,
-                "fuel_moisture_data": fuel_moisture_data
+                "output": output.strip()
             }
+            if echo_inputs:
+                result["weather_data"] = weather_data
+                result["fuel_moisture_data"] = fuel_moisture_data
+            return result
             
         except Exception as e:
             return {
@@ -563,7 +613,7 @@ result
         return await self.call_lisflood_model("simulation", kwargs)
     
     async def disconnect_from_model(self, model_name: str) -> bool:
-        """Disconnect from a specific model server."""
+        """Disconnect from a specific model server and drop its cached ping."""
         if model_name in self.active_connections:
             del self.active_connections[model_name]
             return True
@@ -577,7 +627,7 @@ result
                 "model": model_name,
                 "status": "connected" if connection["connected"] else "disconnected",
                 "endpoint": connection["endpoint"],
-                "last_ping": connection["last_ping"].isoformat()
+                "last_ping": self._monotonic_ns_to_iso(connection["last_ping_ns"])
             }
         else:
             return {
@@ -587,11 +637,20 @@ result
                 "last_ping": None
             }
     
+    @staticmethod
+    def _monotonic_ns_to_iso(monotonic_ns: int) -> str:
+        """Convert a ``time.monotonic_ns()`` stamp to a local ISO timestamp."""
+        elapsed = (time.monotonic_ns() - monotonic_ns) / 1e9
+        return datetime.fromtimestamp(time.time() - elapsed).isoformat()
+    
     async def health_check_legacy(self) -> Dict[str, Any]:
         """Check health of all model connections."""
-        health_status = {}
-        for model_name in self.model_endpoints.keys():
-            health_status[model_name] = await self.get_model_status(model_name)
+        async with asyncio.TaskGroup() as tg:
+            tasks = {
+                model_name: tg.create_task(self.get_model_status(model_name))
+                for model_name in self.model_endpoints
+            }
+        health_status = {model_name: task.result() for model_name, task in tasks.items()}
         
         return {
             "timestamp": datetime.now().isoformat(),
@@ -8,14 +8,25 @@ must implement.
 import asyncio
 import json
 import logging
+import os
+import shutil
 import subprocess
 import tempfile
+import time
+import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Coroutine, Dict, List, Optional, Union
+
+from .environment_manager import collect_output, environment_manager
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +40,11 @@ class ModelStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+# Precomputed enum values so serialization avoids the Enum.value descriptor
+_STATUS_VALUES = {status: status.value for status in ModelStatus}
+
+
+@dataclass(slots=True)
 class ModelResult:
     """Standardized result from model execution."""
     
@@ -58,12 +73,20 @@ class ModelResult:
     command: Optional[str] = None
     working_directory: Optional[str] = None
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert result to dictionary."""
-        return {
+    # Serialized form, built on first use (results are not mutated once created)
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def _as_dict(self) -> Dict[str, Any]:
+        """Return the cached dictionary form of this result."""
+        if self._dict_cache is not None:
+            return self._dict_cache
+        
+        self._dict_cache = {
             "model_name": self.model_name,
             "tool_name": self.tool_name,
-            "status": self.status.value,
+            "status": _STATUS_VALUES[self.status],
             "execution_id": self.execution_id,
             "start_time": self.start_time.isoformat(),
             "end_time": self.end_time.isoformat() if self.end_time else None,
@@ -77,10 +100,71 @@ class ModelResult:
             "command": self.command,
             "working_directory": self.working_directory
         }
+        return self._dict_cache
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert result to dictionary."""
+        return dict(self._as_dict())
     
     def to_json(self) -> str:
         """Convert result to JSON string."""
-        return json.dumps(self.to_dict(), indent=2, default=str)
+        if orjson is None:
+            return json.dumps(self._as_dict(), indent=2, default=str)
+        
+        return orjson.dumps(
+            self._as_dict(),
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+
+
+class ExecutionDirPool:
+    """
+    Pool of reusable scratch directories for model executions.
+    
+    Released directories are emptied and kept for the next execution instead
+    of being removed, so each run avoids a mkdtemp/rmtree cycle. A reused
+    directory is renamed for its new execution, so names always carry the
+    execution_id of the run using them.
+    """
+    
+    def __init__(self, prefix: str, max_idle: int = 8):
+        self.prefix = prefix
+        self.max_idle = max_idle
+        self._idle: List[Path] = []
+    
+    async def acquire(self, execution_id: str) -> Path:
+        """Get an empty directory named for an execution, creating one if none is idle."""
+        prefix = f"{self.prefix}{execution_id}_"
+        while self._idle:
+            path = self._idle.pop()
+            renamed = path.with_name(prefix + uuid.uuid4().hex[:8])
+            try:
+                path.rename(renamed)
+            except OSError:
+                continue
+            return renamed
+        return Path(tempfile.mkdtemp(prefix=prefix))
+    
+    async def release(self, path: Path):
+        """Empty a directory and return it to the pool."""
+        # Filesystem cleanup can be slow for large outputs, keep it off the event loop
+        if len(self._idle) >= self.max_idle:
+            await asyncio.to_thread(shutil.rmtree, path, ignore_errors=True)
+            return
+        
+        await asyncio.to_thread(self._clear, path)
+        self._idle.append(path)
+    
+    @staticmethod
+    def _clear(path: Path):
+        """Remove everything inside a directory but keep the directory itself."""
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.remove(entry.path)
 
 
 class BaseModel(ABC):
@@ -96,6 +180,7 @@ class BaseModel(ABC):
         self.version = version
         self.status = ModelStatus.IDLE
         self.current_execution_id: Optional[str] = None
+        self._dir_pool = ExecutionDirPool(prefix=f"{name}_")
         self._setup_logging()
     
     def _setup_logging(self):
@@ -160,9 +245,9 @@ class BaseModel(ABC):
         Returns:
             Path to the execution directory
         """
-        # Create temporary directory for this execution
-        temp_dir = Path(tempfile.mkdtemp(prefix=f"{self.name}_{execution_id}_"))
-        self.logger.info(f"Created execution directory: {temp_dir}")
+        # Reuse a pooled scratch directory for this execution
+        temp_dir = await self._dir_pool.acquire(execution_id)
+        self.logger.info("Using execution directory for %s: %s", execution_id, temp_dir)
         return temp_dir
     
     async def cleanup_execution_environment(self, execution_dir: Path):
@@ -173,9 +258,8 @@ class BaseModel(ABC):
             execution_dir: Path to the execution directory
         """
         try:
-            import shutil
-            shutil.rmtree(execution_dir)
-            self.logger.info(f"Cleaned up execution directory: {execution_dir}")
+            await self._dir_pool.release(execution_dir)
+            self.logger.info("Cleaned up execution directory: %s", execution_dir)
         except Exception as e:
             self.logger.warning(f"Failed to cleanup {execution_dir}: {e}")
     
@@ -183,7 +267,8 @@ class BaseModel(ABC):
         self, 
         command: List[str], 
         working_dir: Optional[Path] = None,
-        timeout: int = 3600
+        timeout: int = 3600,
+        max_output_bytes: Optional[int] = None
     ) -> subprocess.CompletedProcess:
         """
         Run a command in the model's Conda environment.
@@ -192,35 +277,43 @@ class BaseModel(ABC):
             command: Command to execute
             working_dir: Working directory for execution
             timeout: Timeout in seconds
+            max_output_bytes: Keep only this much of the tail of each output
+                stream, marked as truncated (None keeps the full output)
             
         Returns:
             CompletedProcess result
         """
-        # Prepare command with conda activation
-        conda_cmd = [
-            "conda", "run", "-n", self.conda_environment,
-            "--no-capture-output"
-        ] + command
+        # Run directly from the environment's bin directory
+        await environment_manager.start()
+        conda_cmd, process_env = environment_manager.resolve_command(
+            self.conda_environment, command
+        )
         
-        self.logger.info(f"Executing: {' '.join(conda_cmd)}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Executing: %s", " ".join(conda_cmd))
         
         # Execute command
         process = await asyncio.create_subprocess_exec(
             *conda_cmd,
             cwd=working_dir,
+            env=process_env,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE
         )
         
         try:
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(), 
-                timeout=timeout
-            )
-        except asyncio.TimeoutError:
+            async with asyncio.timeout(timeout):
+                stdout, stderr = await collect_output(process, max_output_bytes)
+        except TimeoutError:
             process.kill()
             await process.wait()
             raise TimeoutError(f"Command timed out after {timeout} seconds")
+        except asyncio.CancelledError:
+            # Don't leave the model process running when the execution is cancelled
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            raise
         
         result = subprocess.CompletedProcess(
             args=conda_cmd,
@@ -240,6 +333,7 @@ class BaseModel(ABC):
         tool_name: str,
         execution_id: str,
         status: ModelStatus = ModelStatus.COMPLETED,
+        start_ns: Optional[int] = None,
         **kwargs
     ) -> ModelResult:
         """
@@ -249,17 +343,23 @@ class BaseModel(ABC):
             tool_name: Name of the executed tool
             execution_id: Execution identifier
             status: Execution status
+            start_ns: ``time.monotonic_ns()`` taken when execution started;
+                used to fill in ``duration`` and ``end_time``
             **kwargs: Additional result data
             
         Returns:
             ModelResult instance
         """
+        if start_ns is not None:
+            kwargs.setdefault("duration", (time.monotonic_ns() - start_ns) / 1e9)
+            kwargs.setdefault("end_time", datetime.now())
+        kwargs.setdefault("start_time", datetime.now())
+        
         return ModelResult(
             model_name=self.name,
             tool_name=tool_name,
             status=status,
             execution_id=execution_id,
-            start_time=datetime.now(),
             environment=self.conda_environment,
             **kwargs
         )
@@ -268,4 +368,48 @@ class BaseModel(ABC):
         return f"{self.__class__.__name__}(name={self.name}, version={self.version})"
     
     def __repr__(self) -> str:
-        return self.__str__()
\ No newline at end of file
+        return self.__str__()
+
+
+def notify_ready():
+    """
+    Tell the server manager that this server has finished starting.
+    
+    The manager passes the write end of a pipe in ``MCP_READY_FD``; writing a
+    line to it replaces a fixed startup delay. Does nothing when the server
+    was not started by the manager.
+    """
+    ready_fd = os.environ.pop("MCP_READY_FD", None)
+    if ready_fd is None:
+        return
+    
+    try:
+        os.write(int(ready_fd), b"READY\n")
+        os.close(int(ready_fd))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not signal readiness on fd {ready_fd}: {e}")
+
+
+def run_server(main: Coroutine) -> Any:
+    """
+    Run a server's ``main()`` coroutine until it completes.
+    
+    Uses uvloop's event loop, which has less per-call overhead for the
+    subprocess and pipe I/O used to drive models, when ``MCP_USE_UVLOOP`` is
+    set and uvloop is installed; otherwise the default asyncio loop.
+    """
+    if os.getenv("MCP_USE_UVLOOP", "").lower() in ("1", "true", "yes"):
+        try:
+            import uvloop
+        except ImportError:
+            logger.warning("MCP_USE_UVLOOP is set but uvloop is not installed")
+        else:
+            return uvloop.run(main)
+    return asyncio.run(main)
+
+
+def result_to_json(result: Any) -> str:
+    """Serialize a tool result as compact JSON for an MCP text response."""
+    if orjson is not None:
+        return orjson.dumps(result, default=str, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(result, default=str)
@@ -9,13 +9,89 @@ import asyncio
 import json
 import logging
 import os
+import shutil
 import subprocess
 import tempfile
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Union
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - optional speedup
+    from json import loads as json_loads
 
 logger = logging.getLogger(__name__)
 
+# Window and size limit for coalescing concurrent install_packages calls
+INSTALL_BATCH_WINDOW = 0.1  # seconds
+INSTALL_BATCH_MAX_PACKAGES = 20
+
+# Tail of subprocess output kept in memory by commands that opt into a cap
+OUTPUT_TAIL_BYTES = 1024 * 1024
+
+# On-disk cache of the detected Conda base, shared across processes
+CONDA_BASE_CACHE_FILE = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "mcp" / "conda_base"
+)
+
+
+async def _read_tail(stream: asyncio.StreamReader, max_bytes: int) -> bytes:
+    """
+    Read a stream to EOF, keeping at most its last ``max_bytes`` bytes.
+    
+    If output was dropped, the kept tail starts on a line boundary (or on a
+    UTF-8 character boundary for one very long line), so it still decodes,
+    and is prefixed with a line saying how many bytes were cut.
+    """
+    chunks: deque = deque()
+    size = 0
+    total = 0
+    while chunk := await stream.read(64 * 1024):
+        chunks.append(chunk)
+        size += len(chunk)
+        total += len(chunk)
+        while size - len(chunks[0]) >= max_bytes:
+            size -= len(chunks.popleft())
+    
+    data = b"".join(chunks)
+    if total <= max_bytes:
+        return data
+    
+    tail = data[-max_bytes:]
+    newline = tail.find(b"\n")
+    if newline != -1:
+        tail = tail[newline + 1:]
+    else:
+        start = 0
+        while start < len(tail) and 0x80 <= tail[start] < 0xC0:  # continuation bytes
+            start += 1
+        tail = tail[start:]
+    return b"[... %d bytes of output truncated ...]\n" % (total - len(tail)) + tail
+
+
+async def collect_output(
+    process: asyncio.subprocess.Process,
+    max_bytes: Optional[int] = None
+) -> Tuple[bytes, bytes]:
+    """
+    Wait for a process and return its stdout/stderr.
+    
+    With ``max_bytes`` set, output is drained as it is produced and only the
+    last ``max_bytes`` of each stream is kept, behind a truncation marker
+    line, so memory stays bounded for chatty commands such as
+    ``conda install``. By default everything is kept.
+    """
+    if max_bytes is None:
+        return await process.communicate()
+    
+    stdout, stderr, _ = await asyncio.gather(
+        _read_tail(process.stdout, max_bytes),
+        _read_tail(process.stderr, max_bytes),
+        process.wait()
+    )
+    return stdout, stderr
+
 
 class EnvironmentManager:
     """
@@ -31,35 +107,60 @@ class EnvironmentManager:
     def __init__(self):
         self.conda_base_path = self._find_conda_base()
         self.environments: Dict[str, Dict[str, str]] = {}
+        # (env_name, required packages) -> (metadata mtime, results)
+        self._validation_cache: Dict[tuple, Tuple[float, Dict[str, bool]]] = {}
+        self._install_batches: Dict[tuple, Dict] = {}
         self._cache_environments()
     
     def _find_conda_base(self) -> Optional[Path]:
-        """Find the Conda base installation path."""
+        """Find the Conda base installation path, using the on-disk cache if valid."""
+        try:
+            cached = CONDA_BASE_CACHE_FILE.read_text().strip()
+            if cached and Path(cached).exists():
+                logger.debug(f"Using cached Conda base: {cached}")
+                return Path(cached)
+        except OSError:
+            pass
+        
+        base_path = self._detect_conda_base()
+        if base_path:
+            try:
+                CONDA_BASE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+                CONDA_BASE_CACHE_FILE.write_text(str(base_path))
+            except OSError as e:
+                logger.debug(f"Could not write Conda base cache: {e}")
+        return base_path
+    
+    def _detect_conda_base(self) -> Optional[Path]:
+        """Probe common locations and PATH for the Conda base installation."""
         # Try common Conda locations
+        home = os.path.expanduser("~")
         conda_paths = [
-            Path(os.environ.get("CONDA_PREFIX", "")),
-            Path.home() / "anaconda3",
-            Path.home() / "miniconda3", 
-            Path("/opt/anaconda3"),
-            Path("/opt/miniconda3"),
-            Path("C:/ProgramData/Anaconda3"),
-            Path("C:/Users") / os.environ.get("USERNAME", "") / "Anaconda3"
+            os.environ.get("CONDA_PREFIX", ""),
+            os.path.join(home, "anaconda3"),
+            os.path.join(home, "miniconda3"),
+            "/opt/anaconda3",
+            "/opt/miniconda3",
+            "C:/ProgramData/Anaconda3",
+            os.path.join("C:/Users", os.environ.get("USERNAME", ""), "Anaconda3")
         ]
         
         for path in conda_paths:
-            if path.exists() and (path / "bin" / "conda").exists() or (path / "Scripts" / "conda.exe").exists():
+            if path and (
+                os.path.exists(os.path.join(path, "bin", "conda"))
+                or os.path.exists(os.path.join(path, "Scripts", "conda.exe"))
+            ):
                 logger.info(f"Found Conda installation at: {path}")
-                return path
+                return Path(path)
         
         # Try to find conda in PATH
         try:
             result = subprocess.run(
                 ["conda", "info", "--base"],
                 capture_output=True,
-                text=True,
                 check=True
             )
-            base_path = Path(result.stdout.strip())
+            base_path = Path(os.fsdecode(result.stdout.strip()))
             if base_path.exists():
                 logger.info(f"Found Conda base via conda info: {base_path}")
                 return base_path
@@ -78,43 +179,74 @@ class EnvironmentManager:
             result = subprocess.run(
                 ["conda", "env", "list", "--json"],
                 capture_output=True,
-                text=True,
                 check=True
             )
             
-            env_info = json.loads(result.stdout)
-            for env_path in env_info["envs"]:
-                env_path = Path(env_path)
-                env_name = env_path.name
-                
-                self.environments[env_name] = {
-                    "path": str(env_path),
-                    "name": env_name,
-                    "python_version": self._get_python_version(env_path)
-                }
+            env_paths = [Path(p) for p in json_loads(result.stdout)["envs"]]
+            for env_path in env_paths:
+                self._store_environment(env_path, self._get_python_version(env_path))
             
             logger.info(f"Found {len(self.environments)} Conda environments")
             
         except (subprocess.CalledProcessError, json.JSONDecodeError) as e:
             logger.error(f"Failed to list Conda environments: {e}")
     
+    async def refresh(self):
+        """Re-scan Conda environments without blocking the event loop."""
+        if not self.conda_base_path:
+            return
+        
+        try:
+            process = await asyncio.create_subprocess_exec(
+                "conda", "env", "list", "--json",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            stdout, stderr = await process.communicate()
+            if process.returncode != 0:
+                raise subprocess.CalledProcessError(
+                    process.returncode, "conda env list --json", stdout, stderr
+                )
+            
+            env_paths = [Path(p) for p in json_loads(stdout)["envs"]]
+            versions = await asyncio.gather(*(
+                asyncio.to_thread(self._get_python_version, env_path)
+                for env_path in env_paths
+            ))
+            for env_path, python_version in zip(env_paths, versions):
+                self._store_environment(env_path, python_version)
+            
+            logger.info(f"Found {len(self.environments)} Conda environments")
+            
+        except (OSError, subprocess.CalledProcessError, json.JSONDecodeError) as e:
+            logger.error(f"Failed to list Conda environments: {e}")
+    
+    def _store_environment(self, env_path: Path, python_version: str):
+        """Record a Conda environment in the cache."""
+        env_name = env_path.name
+        self.environments[env_name] = {
+            "path": str(env_path),
+            "name": env_name,
+            "bin": str(env_path if os.name == "nt" else env_path / "bin"),
+            "python_version": python_version
+        }
+    
     def _get_python_version(self, env_path: Path) -> str:
         """Get Python version for a specific environment."""
         try:
             if os.name == "nt":  # Windows
-                python_exe = env_path / "python.exe"
+                python_exe = os.path.join(env_path, "python.exe")
             else:
-                python_exe = env_path / "bin" / "python"
+                python_exe = os.path.join(env_path, "bin", "python")
             
-            if python_exe.exists():
+            if os.path.exists(python_exe):
                 result = subprocess.run(
-                    [str(python_exe), "--version"],
+                    [python_exe, "--version"],
                     capture_output=True,
-                    text=True,
                     timeout=10
                 )
                 if result.returncode == 0:
-                    return result.stdout.strip().split()[-1]
+                    return result.stdout.strip().split()[-1].decode("ascii")
         except Exception:
             pass
         
@@ -156,6 +288,14 @@ class EnvironmentManager:
         
         results["environment_exists"] = True
         
+        # Reuse the last result while the environment's package metadata is
+        # unchanged; without an mtime there is nothing to detect changes by
+        cache_key = (env_name, frozenset(required_packages or ()))
+        mtime = self._environment_mtime(env_name)
+        cached = self._validation_cache.get(cache_key) if mtime is not None else None
+        if cached is not None and cached[0] == mtime:
+            return dict(cached[1])
+        
         # Test environment accessibility
         try:
             await self._run_in_environment(
@@ -176,36 +316,88 @@ class EnvironmentManager:
         else:
             results["packages_installed"] = True
         
+        # Replaces any result for an older mtime
+        if mtime is not None:
+            self._validation_cache[cache_key] = (mtime, dict(results))
         return results
     
+    def _environment_mtime(self, env_name: str) -> Optional[float]:
+        """Modification time of an environment's package metadata."""
+        env_path = Path(self.environments[env_name]["path"])
+        try:
+            return (env_path / "conda-meta").stat().st_mtime
+        except OSError:
+            try:
+                return env_path.stat().st_mtime
+            except OSError:
+                return None
+    
+    def _invalidate_validation(self, env_name: str):
+        """Drop cached validation results for an environment."""
+        for key in [key for key in self._validation_cache if key[0] == env_name]:
+            del self._validation_cache[key]
+    
     async def _check_packages(self, env_name: str, packages: List[str]) -> List[str]:
         """Check which packages are missing from an environment."""
-        missing = []
+        try:
+            # List the whole environment once instead of one conda call per package
+            result = await self._run_in_environment(
+                env_name,
+                ["conda", "list", "--json", "-n", env_name],
+                timeout=60
+            )
+            installed = {pkg["name"].lower() for pkg in json_loads(result.stdout)}
+        except Exception as e:
+            logger.warning(f"Could not list packages in '{env_name}': {e}")
+            return list(packages)
         
-        for package in packages:
-            try:
-                # Use conda list to check if package is installed
-                result = await self._run_in_environment(
-                    env_name,
-                    ["conda", "list", package],
-                    timeout=30
-                )
-                
-                if package not in result.stdout.decode():
-                    missing.append(package)
-                    
-            except Exception as e:
-                logger.warning(f"Could not check package '{package}': {e}")
-                missing.append(package)
+        return [package for package in packages if package.lower() not in installed]
+    
+    def resolve_command(
+        self,
+        env_name: str,
+        command: List[str]
+    ) -> Tuple[List[str], Optional[Dict[str, str]]]:
+        """
+        Build the argv and process environment to run a command in an env.
+        
+        Known environments run the executable straight from the env's bin
+        directory with PATH/CONDA_PREFIX set, avoiding a ``conda run``
+        launcher per command. Unknown environments fall back to ``conda run``.
         
-        return missing
+        Args:
+            env_name: Name of the Conda environment
+            command: Command to execute
+            
+        Returns:
+            Tuple of (argv, environment variables or None to inherit)
+        """
+        env_info = self.environments.get(env_name)
+        if not env_info:
+            return ["conda", "run", "-n", env_name, "--no-capture-output"] + command, None
+        
+        bin_dir = env_info["bin"]
+        path_dirs = [bin_dir]
+        if os.name == "nt":
+            path_dirs.append(os.path.join(bin_dir, "Scripts"))
+        env_path = os.pathsep.join(path_dirs)
+        
+        executable = shutil.which(command[0], path=env_path) or command[0]
+        process_env = {
+            **os.environ,
+            "PATH": env_path + os.pathsep + os.environ.get("PATH", ""),
+            "CONDA_PREFIX": env_info["path"],
+            "CONDA_DEFAULT_ENV": env_name
+        }
+        return [executable] + command[1:], process_env
     
     async def _run_in_environment(
         self, 
         env_name: str, 
         command: List[str],
         timeout: int = 300,
-        cwd: Optional[Path] = None
+        cwd: Optional[Path] = None,
+        max_output_bytes: Optional[int] = None
     ) -> subprocess.CompletedProcess:
         """
         Run a command in a specific Conda environment.
@@ -215,35 +407,39 @@ class EnvironmentManager:
             command: Command to execute
             timeout: Timeout in seconds
             cwd: Working directory
+            max_output_bytes: Keep only this much of the tail of each output
+                stream, marked as truncated (None keeps the full output)
             
         Returns:
             CompletedProcess result
         """
-        # Prepare conda run command
-        conda_cmd = [
-            "conda", "run", "-n", env_name,
-            "--no-capture-output"
-        ] + command
+        conda_cmd, process_env = self.resolve_command(env_name, command)
         
-        logger.debug(f"Running in {env_name}: {' '.join(conda_cmd)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Running in %s: %s", env_name, " ".join(conda_cmd))
         
         # Execute command
         process = await asyncio.create_subprocess_exec(
             *conda_cmd,
             cwd=cwd,
+            env=process_env,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE
         )
         
         try:
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=timeout
-            )
-        except asyncio.TimeoutError:
+            async with asyncio.timeout(timeout):
+                stdout, stderr = await collect_output(process, max_output_bytes)
+        except TimeoutError:
             process.kill()
             await process.wait()
             raise TimeoutError(f"Command timed out after {timeout} seconds")
+        except asyncio.CancelledError:
+            # Don't leave the child running when the caller is cancelled
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            raise
         
         return subprocess.CompletedProcess(
             args=conda_cmd,
@@ -293,7 +489,8 @@ class EnvironmentManager:
             if process.returncode == 0:
                 logger.info(f"Successfully created environment '{env_name}'")
                 # Refresh environment cache
-                self._cache_environments()
+                await self.refresh()
+                self._invalidate_validation(env_name)
                 return True
             else:
                 logger.error(f"Failed to create environment '{env_name}': {stderr.decode()}")
@@ -312,6 +509,10 @@ class EnvironmentManager:
         """
         Install packages in a Conda environment.
         
+        Concurrent calls for the same environment are batched into a single
+        ``conda install``/``pip install`` run, so the solver runs once per
+        batch rather than once per call.
+        
         Args:
             env_name: Name of the environment
             packages: List of packages to install
@@ -324,16 +525,55 @@ class EnvironmentManager:
             logger.error(f"Environment '{env_name}' does not exist")
             return False
         
+        key = (env_name, use_pip)
+        batch = self._install_batches.get(key)
+        if batch is None:
+            batch = {
+                "packages": [],
+                "full": asyncio.Event(),
+                "future": asyncio.get_running_loop().create_future()
+            }
+            self._install_batches[key] = batch
+            batch["task"] = asyncio.create_task(self._flush_install_batch(key, batch))
+        
+        batch["packages"].extend(p for p in packages if p not in batch["packages"])
+        if len(batch["packages"]) >= INSTALL_BATCH_MAX_PACKAGES:
+            batch["full"].set()
+        
+        return await asyncio.shield(batch["future"])
+    
+    async def _flush_install_batch(self, key: tuple, batch: Dict):
+        """Wait for the batch window to close, then install all queued packages."""
+        try:
+            async with asyncio.timeout(INSTALL_BATCH_WINDOW):
+                await batch["full"].wait()
+        except TimeoutError:
+            pass
+        
+        if self._install_batches.get(key) is batch:
+            del self._install_batches[key]
+        
+        env_name, use_pip = key
+        batch["future"].set_result(
+            await self._install_now(env_name, batch["packages"], use_pip)
+        )
+    
+    async def _install_now(self, env_name: str, packages: List[str], use_pip: bool) -> bool:
+        """Run a single install command for a batch of packages."""
         try:
             if use_pip:
                 cmd = ["pip", "install"] + packages
             else:
                 cmd = ["conda", "install", "-y"] + packages
             
-            result = await self._run_in_environment(env_name, cmd, timeout=1800)
+            # Only the end of conda/pip install logs is worth keeping
+            result = await self._run_in_environment(
+                env_name, cmd, timeout=1800, max_output_bytes=OUTPUT_TAIL_BYTES
+            )
             
             if result.returncode == 0:
                 logger.info(f"Successfully installed packages in '{env_name}': {packages}")
+                self._invalidate_validation(env_name)
                 return True
             else:
                 logger.error(f"Failed to install packages: {result.stderr.decode()}")
@@ -372,5 +612,45 @@ class EnvironmentManager:
             logger.warning(f"Could not clean conda cache: {e}")
 
 
-# Global environment manager instance
-environment_manager = EnvironmentManager()
\ No newline at end of file
+class _LazyEnvironmentManager:
+    """
+    Proxy for the global EnvironmentManager.
+    
+    Construction runs blocking Conda discovery, so async code must build it
+    with ``await environment_manager.start()`` (at startup) before use.
+    Synchronous callers still get it built on first attribute access.
+    """
+    
+    def __init__(self):
+        self._instance: Optional[EnvironmentManager] = None
+        self._start_lock: Optional[asyncio.Lock] = None
+    
+    async def start(self) -> EnvironmentManager:
+        """Build the EnvironmentManager in a worker thread if not built yet."""
+        if self._instance is None:
+            if self._start_lock is None:
+                self._start_lock = asyncio.Lock()
+            async with self._start_lock:
+                if self._instance is None:
+                    self._instance = await asyncio.to_thread(EnvironmentManager)
+        return self._instance
+    
+    def _get(self) -> EnvironmentManager:
+        if self._instance is None:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                self._instance = EnvironmentManager()
+            else:
+                raise RuntimeError(
+                    "environment_manager used from async code before "
+                    "'await environment_manager.start()'"
+                )
+        return self._instance
+    
+    def __getattr__(self, name: str):
+        return getattr(self._get(), name)
+
+
+# Global environment manager instance (Conda discovery runs in start())
+environment_manager = _LazyEnvironmentManager()
\ No newline at end of file
@@ -7,9 +7,15 @@ orchestration.
 """
 
 import asyncio
+import bisect
+import heapq
+import itertools
 import logging
+import time
 import uuid
-from typing import Any, Dict, List, Optional, Type, Union
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
 from langchain_core.tools import BaseTool
 from langgraph.graph import StateGraph
@@ -21,6 +27,24 @@ from .tool_registry import tool_registry, ToolMetadata
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class QueuedExecution:
+    """
+    A tool execution waiting for router capacity.
+    
+    The future resolves to None when an execution slot is handed over, or
+    to an error result if the execution is dropped while queued.
+    """
+    
+    tool_name: str
+    parameters: Dict[str, Any]
+    execution_id: str
+    priority: int
+    model_name: str
+    future: asyncio.Future = field(repr=False)
+    cancelled: bool = False
+
+
 class MCPRouter:
     """
     Intelligent router for MCP tool execution.
@@ -32,8 +56,19 @@ class MCPRouter:
     def __init__(self):
         self._models: Dict[str, BaseModel] = {}
         self._active_executions: Dict[str, str] = {}  # execution_id -> model_name
-        self._execution_queue: List[Dict[str, Any]] = []
+        # Holds free execution slots; created on first use inside the event loop
+        self._slots: Optional[asyncio.Semaphore] = None
+        # Min-heap of (-priority, sequence, request); cancelled requests stay as tombstones
+        self._execution_heap: List[Tuple[int, int, QueuedExecution]] = []
+        self._queue_seq = itertools.count()
+        # execution_id -> heap entry for executions still waiting
+        self._queued_by_id: Dict[str, Tuple[int, int, QueuedExecution]] = {}
+        # Sorted (-priority, sequence) keys of the waiting executions, for queue positions
+        self._queued_order: List[Tuple[int, int]] = []
         self._max_concurrent_executions = 3
+        # model_name -> (expires_at, valid); validation probes can be slow
+        self._env_cache: Dict[str, Tuple[float, bool]] = {}
+        self._env_ttl = 30.0  # seconds
     
     def register_model(self, model: BaseModel):
         """
@@ -59,12 +94,10 @@ class MCPRouter:
             return False
         
         del self._models[model_name]
+        self._env_cache.pop(model_name, None)
         
-        # Remove any queued executions for this model
-        self._execution_queue = [
-            exec_req for exec_req in self._execution_queue
-            if exec_req.get("model_name") != model_name
-        ]
+        # Queued executions for this model are failed when they reach the
+        # front of the queue, so their callers still receive a result
         
         logger.info(f"Unregistered model '{model_name}' from router")
         return True
@@ -120,14 +153,17 @@ class MCPRouter:
         if validation_error:
             return self._create_error_result(tool_name, execution_id, validation_error)
         
-        # Check if we need to queue the execution
-        if len(self._active_executions) >= self._max_concurrent_executions:
-            return await self._queue_execution(
-                tool_name, parameters, execution_id, priority, model_name
-            )
+        # Wait for an execution slot (higher priority waiters go first)
+        rejected = await self._acquire_slot(
+            tool_name, parameters, execution_id, priority, model_name
+        )
+        if rejected is not None:
+            return rejected
         
-        # Execute directly
-        return await self._execute_directly(model, tool_name, parameters, execution_id)
+        try:
+            return await self._execute_directly(model, tool_name, parameters, execution_id)
+        finally:
+            self._release_slot()
     
     def _validate_parameters(
         self, 
@@ -135,15 +171,9 @@ class MCPRouter:
         parameters: Dict[str, Any]
     ) -> Optional[str]:
         """Validate tool parameters against metadata."""
-        required_params = []
-        for param_name, param_info in tool_metadata.parameters.items():
-            if isinstance(param_info, dict) and param_info.get("required", False):
-                required_params.append(param_name)
-        
-        # Check required parameters
-        missing_params = [p for p in required_params if p not in parameters]
+        missing_params = tool_metadata.required_params - parameters.keys()
         if missing_params:
-            return f"Missing required parameters: {missing_params}"
+            return f"Missing required parameters: {sorted(missing_params)}"
         
         return None
     
@@ -160,7 +190,7 @@ class MCPRouter:
         
         try:
             # Validate model environment
-            if not await model.validate_environment():
+            if not await self._validate_env_cached(model):
                 return self._create_error_result(
                     tool_name,
                     execution_id,
@@ -177,6 +207,8 @@ class MCPRouter:
             
         except Exception as e:
             logger.error(f"Error executing tool '{tool_name}': {e}")
+            # The failure may come from a broken environment, probe again next time
+            self._env_cache.pop(model.name, None)
             return self._create_error_result(
                 tool_name,
                 execution_id,
@@ -185,88 +217,112 @@ class MCPRouter:
         
         finally:
             # Remove from active executions
-            if execution_id in self._active_executions:
-                del self._active_executions[execution_id]
-            
-            # Process queue
-            await self._process_queue()
+            self._active_executions.pop(execution_id, None)
+    
+    async def _validate_env_cached(self, model: BaseModel) -> bool:
+        """Validate a model's environment, reusing the result for ``_env_ttl`` seconds."""
+        now = time.monotonic()
+        cached = self._env_cache.get(model.name)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        
+        is_valid = await model.validate_environment()
+        self._env_cache[model.name] = (now + self._env_ttl, is_valid)
+        return is_valid
     
-    async def _queue_execution(
+    async def _acquire_slot(
         self,
         tool_name: str,
         parameters: Dict[str, Any],
         execution_id: str,
         priority: int,
         model_name: str
-    ) -> ModelResult:
-        """Queue an execution for later processing."""
-        execution_request = {
-            "tool_name": tool_name,
-            "parameters": parameters,
-            "execution_id": execution_id,
-            "priority": priority,
-            "model_name": model_name,
-            "future": asyncio.Future()
-        }
+    ) -> Optional[ModelResult]:
+        """
+        Wait until an execution slot is available.
         
-        # Insert based on priority
-        insert_index = 0
-        for i, req in enumerate(self._execution_queue):
-            if req["priority"] < priority:
-                insert_index = i
-                break
-            insert_index = i + 1
+        Returns:
+            None once a slot is held, or an error result if the execution
+            was cancelled or its model was removed while queued
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self._max_concurrent_executions)
         
-        self._execution_queue.insert(insert_index, execution_request)
+        # Slots are handed straight to queued waiters, so a free slot means
+        # nobody is waiting ahead of us
+        if not self._slots.locked():
+            await self._slots.acquire()
+            return None
         
-        logger.info(f"Queued execution '{execution_id}' (position: {insert_index})")
+        execution_request = QueuedExecution(
+            tool_name=tool_name,
+            parameters=parameters,
+            execution_id=execution_id,
+            priority=priority,
+            model_name=model_name,
+            future=asyncio.get_running_loop().create_future()
+        )
         
-        # Return future result
-        return await execution_request["future"]
-    
-    async def _process_queue(self):
-        """Process queued executions if capacity is available."""
-        while (
-            self._execution_queue and 
-            len(self._active_executions) < self._max_concurrent_executions
-        ):
-            # Get next execution
-            execution_request = self._execution_queue.pop(0)
-            
-            model_name = execution_request["model_name"]
-            if model_name not in self._models:
-                # Model no longer available
-                execution_request["future"].set_result(
-                    self._create_error_result(
-                        execution_request["tool_name"],
-                        execution_request["execution_id"],
-                        f"Model '{model_name}' no longer available"
-                    )
-                )
-                continue
-            
-            # Execute asynchronously
-            asyncio.create_task(self._execute_queued_request(execution_request))
-    
-    async def _execute_queued_request(self, execution_request: Dict[str, Any]):
-        """Execute a queued request."""
-        model = self._models[execution_request["model_name"]]
+        # Higher priority first, FIFO within the same priority
+        entry = (-priority, next(self._queue_seq), execution_request)
+        heapq.heappush(self._execution_heap, entry)
+        self._queued_by_id[execution_id] = entry
+        bisect.insort(self._queued_order, entry[:2])
         
+        logger.info(f"Queued execution '{execution_id}' (priority: {priority})")
+        
+        future = execution_request.future
         try:
-            result = await self._execute_directly(
-                model,
-                execution_request["tool_name"],
-                execution_request["parameters"],
-                execution_request["execution_id"]
-            )
-            execution_request["future"].set_result(result)
-        except Exception as e:
-            error_result = self._create_error_result(
-                execution_request["tool_name"],
-                execution_request["execution_id"],
-                f"Queued execution error: {str(e)}"
+            return await future
+        except asyncio.CancelledError:
+            execution_request.cancelled = True
+            self._forget_queued(entry)
+            if future.done() and not future.cancelled() and future.result() is None:
+                # The slot was handed over just as the caller was cancelled
+                self._release_slot()
+            raise
+    
+    def _release_slot(self):
+        """Hand a finished execution's slot to the highest-priority waiter."""
+        while self._execution_heap:
+            entry = heapq.heappop(self._execution_heap)
+            self._forget_queued(entry)
+            execution_request = entry[2]
+            reason = self._reject_reason(execution_request)
+            if reason is None:
+                execution_request.future.set_result(None)
+                return
+            self._fast_fail(execution_request, reason)
+        
+        self._slots.release()
+    
+    def _forget_queued(self, entry: Tuple[int, int, QueuedExecution]):
+        """Drop a heap entry from the execution_id index and the queue order."""
+        execution_id = entry[2].execution_id
+        if self._queued_by_id.get(execution_id) is entry:
+            del self._queued_by_id[execution_id]
+            index = bisect.bisect_left(self._queued_order, entry[:2])
+            del self._queued_order[index]
+    
+    def _reject_reason(self, execution_request: QueuedExecution) -> Optional[str]:
+        """Return why a queued execution cannot start, or None if it can."""
+        if execution_request.cancelled or execution_request.future.done():
+            return "Execution cancelled"
+        if execution_request.model_name not in self._models:
+            return f"Model '{execution_request.model_name}' no longer available"
+        return None
+    
+    def _fast_fail(self, execution_request: QueuedExecution, reason: str):
+        """Resolve a queued execution that will not run with an error result."""
+        # Cancelled requests were already resolved by cancel_execution or their caller
+        if not execution_request.future.done():
+            execution_request.future.set_result(
+                self._create_error_result(
+                    execution_request.tool_name,
+                    execution_request.execution_id,
+                    reason
+                )
             )
-            execution_request["future"].set_result(error_result)
     
     def _create_error_result(
         self, 
@@ -275,15 +331,14 @@ class MCPRouter:
         error_message: str
     ) -> ModelResult:
         """Create a standardized error result."""
-        from datetime import datetime
-        
+        now = datetime.now()
         return ModelResult(
             model_name="router",
             tool_name=tool_name,
             status=ModelStatus.FAILED,
             execution_id=execution_id,
-            start_time=datetime.now(),
-            end_time=datetime.now(),
+            start_time=now,
+            end_time=now,
             error=error_message
         )
     
@@ -298,16 +353,18 @@ class MCPRouter:
             }
         
         # Check queue
-        for i, req in enumerate(self._execution_queue):
-            if req["execution_id"] == execution_id:
-                return {
-                    "execution_id": execution_id,
-                    "status": "queued",
-                    "position": i,
-                    "model_name": req["model_name"]
-                }
+        entry = self._queued_by_id.get(execution_id)
+        if entry is None:
+            return None
         
-        return None
+        # Only waiting executions are in the order list, so tombstones are not counted
+        position = bisect.bisect_left(self._queued_order, entry[:2])
+        return {
+            "execution_id": execution_id,
+            "status": "queued",
+            "position": position,
+            "model_name": entry[2].model_name
+        }
     
     async def cancel_execution(self, execution_id: str) -> bool:
         """
@@ -319,20 +376,21 @@ class MCPRouter:
         Returns:
             True if cancelled, False if not found or cannot be cancelled
         """
-        # Check queue first
-        for i, req in enumerate(self._execution_queue):
-            if req["execution_id"] == execution_id:
-                # Remove from queue
-                cancelled_req = self._execution_queue.pop(i)
-                cancelled_req["future"].set_result(
-                    self._create_error_result(
-                        cancelled_req["tool_name"],
-                        execution_id,
-                        "Execution cancelled by user"
-                    )
+        # Check queue first; the entry is left in the heap as a tombstone
+        entry = self._queued_by_id.get(execution_id)
+        if entry is not None:
+            self._forget_queued(entry)
+            req = entry[2]
+            req.cancelled = True
+            req.future.set_result(
+                self._create_error_result(
+                    req.tool_name,
+                    execution_id,
+                    "Execution cancelled by user"
                 )
-                logger.info(f"Cancelled queued execution '{execution_id}'")
-                return True
+            )
+            logger.info(f"Cancelled queued execution '{execution_id}'")
+            return True
         
         # Cannot cancel running executions directly
         # (would require model-specific cancellation logic)
@@ -343,34 +401,41 @@ class MCPRouter:
         return {
             "registered_models": len(self._models),
             "active_executions": len(self._active_executions),
-            "queued_executions": len(self._execution_queue),
+            "queued_executions": len(self._queued_by_id),
             "max_concurrent_executions": self._max_concurrent_executions,
             "model_names": list(self._models.keys())
         }
     
     async def health_check(self) -> Dict[str, Any]:
         """Perform health check on all registered models."""
-        health_results = {}
-        
-        for model_name, model in self._models.items():
-            try:
-                is_healthy = await model.validate_environment()
-                health_results[model_name] = {
-                    "status": "healthy" if is_healthy else "unhealthy",
-                    "environment": model.conda_environment,
-                    "available_tools": len(model.available_tools)
-                }
-            except Exception as e:
-                health_results[model_name] = {
-                    "status": "error",
-                    "error": str(e)
-                }
+        models = list(self._models.items())
+        results = await asyncio.gather(
+            *(self._safe_validate(model) for _, model in models)
+        )
+        health_results = {
+            model_name: result for (model_name, _), result in zip(models, results)
+        }
         
         return {
             "router_status": "healthy",
             "models": health_results,
             "stats": self.get_router_stats()
         }
+    
+    async def _safe_validate(self, model: BaseModel) -> Dict[str, Any]:
+        """Validate one model for health_check, reporting errors instead of raising."""
+        try:
+            is_healthy = await self._validate_env_cached(model)
+            return {
+                "status": "healthy" if is_healthy else "unhealthy",
+                "environment": model.conda_environment,
+                "available_tools": len(model.available_tools)
+            }
+        except Exception as e:
+            return {
+                "status": "error",
+                "error": str(e)
+            }
 
 
 # Global router instance
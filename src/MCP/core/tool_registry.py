@@ -6,16 +6,69 @@ Provides a centralized registry for tools from different models.
 """
 
 import inspect
+import itertools
 import logging
+import weakref
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Type, Union
 
 from langchain_core.tools import BaseTool
 
 logger = logging.getLogger(__name__)
 
+# Length of the substrings indexed for search; shorter queries scan every tool
+_GRAM = 3
 
-@dataclass
+
+def _grams(text: str) -> Set[str]:
+    """Return every ``_GRAM``-character substring of already lowercased text."""
+    return {text[i:i + _GRAM] for i in range(len(text) - _GRAM + 1)}
+
+
+# callable -> introspected parameters; weak keys so the cache never keeps
+# an unregistered function or class (and its module globals) alive
+_parameter_cache: "weakref.WeakKeyDictionary[Any, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+
+
+def _inspect_callable(callable_obj: Union[Callable, Type[BaseTool]]) -> Dict[str, Any]:
+    """
+    Introspect a callable's parameters.
+    
+    Cached per callable because ``inspect.signature`` and pydantic's
+    ``schema()`` are slow and their results never change for a given object.
+    Callables that cannot be weakly referenced are introspected every time.
+    """
+    try:
+        return _parameter_cache[callable_obj]
+    except (KeyError, TypeError):
+        pass
+    
+    parameters = {}
+    
+    if isinstance(callable_obj, type) and issubclass(callable_obj, BaseTool):
+        # BaseTool subclass - extract from args_schema if available
+        if hasattr(callable_obj, 'args_schema') and callable_obj.args_schema:
+            schema = callable_obj.args_schema.schema()
+            parameters = schema.get('properties', {})
+    else:
+        # Regular function - use inspect
+        sig = inspect.signature(callable_obj)
+        for param_name, param in sig.parameters.items():
+            param_info = {
+                "type": str(param.annotation) if param.annotation != inspect.Parameter.empty else "Any",
+                "required": param.default == inspect.Parameter.empty,
+                "default": param.default if param.default != inspect.Parameter.empty else None
+            }
+            parameters[param_name] = param_info
+    
+    try:
+        _parameter_cache[callable_obj] = parameters
+    except TypeError:
+        pass
+    return parameters
+
+
+@dataclass(slots=True)
 class ToolMetadata:
     """Metadata for a registered tool."""
     
@@ -39,9 +92,20 @@ class ToolMetadata:
     examples: List[Dict[str, Any]] = field(default_factory=list)
     version: str = "1.0.0"
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert metadata to dictionary."""
-        return {
+    # Names of parameters without defaults, precomputed at registration
+    required_params: frozenset = field(default_factory=frozenset)
+    
+    # Serialized form, built on first use (metadata is not mutated after registration)
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def _as_dict(self) -> Dict[str, Any]:
+        """Return the cached dictionary form of this metadata."""
+        if self._dict_cache is not None:
+            return self._dict_cache
+        
+        self._dict_cache = {
             "name": self.name,
             "description": self.description,
             "model_name": self.model_name,
@@ -55,6 +119,11 @@ class ToolMetadata:
             "examples": self.examples,
             "version": self.version
         }
+        return self._dict_cache
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert metadata to dictionary."""
+        return dict(self._as_dict())
 
 
 class ToolRegistry:
@@ -66,8 +135,28 @@ class ToolRegistry:
     
     def __init__(self):
         self._tools: Dict[str, ToolMetadata] = {}
-        self._categories: Dict[str, List[str]] = {}
-        self._models: Dict[str, List[str]] = {}
+        # Index values are dicts used as insertion-ordered sets of tool names
+        self._categories: Dict[str, Dict[str, None]] = {}
+        self._models: Dict[str, Dict[str, None]] = {}
+        self._tags: Dict[str, Set[str]] = {}
+        # Search index: trigram -> tool names, and each tool's lowercased
+        # (name, description, *tags) for removal and match checks
+        self._gram_index: Dict[str, Set[str]] = {}
+        self._search_fields: Dict[str, Tuple[str, ...]] = {}
+        # Registration order of each tool, so search results keep it
+        self._search_order: Dict[str, int] = {}
+        self._search_seq = itertools.count()
+        self._version = 0
+        # (version, value) snapshots for the read-only reporting methods
+        self._stats_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+        self._export_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+        self._all_tools_cache: Optional[Tuple[int, Tuple[ToolMetadata, ...]]] = None
+        self._summary_cache: Optional[Tuple[int, Dict[str, Dict[str, Dict[str, Any]]]]] = None
+    
+    @property
+    def version(self) -> int:
+        """Monotonic counter bumped whenever the set of registered tools changes."""
+        return self._version
     
     def register_tool(
         self,
@@ -91,9 +180,14 @@ class ToolRegistry:
         """
         if name in self._tools:
             logger.warning(f"Tool '{name}' already registered, overwriting")
+            self._remove_from_indexes(self._tools[name])
         
         # Extract parameters from callable
         parameters = self._extract_parameters(callable_obj)
+        required_params = frozenset(
+            param_name for param_name, param_info in parameters.items()
+            if isinstance(param_info, dict) and param_info.get("required", False)
+        )
         
         # Create metadata
         metadata = ToolMetadata(
@@ -103,51 +197,61 @@ class ToolRegistry:
             category=category,
             callable_obj=callable_obj,
             parameters=parameters,
+            required_params=required_params,
             **metadata_kwargs
         )
         
-        # Register tool
+        # Register tool (and build its serialized form once, up front)
         self._tools[name] = metadata
+        metadata._as_dict()
+        self._index_search(metadata)
         
-        # Update category index
-        if category not in self._categories:
-            self._categories[category] = []
-        if name not in self._categories[category]:
-            self._categories[category].append(name)
+        # Update category and model indexes
+        self._categories.setdefault(category, {})[name] = None
+        self._models.setdefault(model_name, {})[name] = None
         
-        # Update model index
-        if model_name not in self._models:
-            self._models[model_name] = []
-        if name not in self._models[model_name]:
-            self._models[model_name].append(name)
+        # Update tag index
+        for tag in metadata.tags:
+            self._tags.setdefault(tag, set()).add(name)
         
+        self._version += 1
         logger.info(f"Registered tool '{name}' from model '{model_name}'")
     
+    def _index_search(self, metadata: ToolMetadata):
+        """Add a tool's name, description and tags to the search index."""
+        self._unindex_search(metadata.name)
+        fields = (metadata.name.lower(), metadata.description.lower()) + tuple(
+            tag.lower() for tag in metadata.tags
+        )
+        self._search_fields[metadata.name] = fields
+        # Re-registering keeps a tool's place, like self._tools does
+        self._search_order.setdefault(metadata.name, next(self._search_seq))
+        for gram in set().union(*map(_grams, fields)):
+            self._gram_index.setdefault(gram, set()).add(metadata.name)
+    
+    def _unindex_search(self, name: str):
+        """Remove a tool from the search index."""
+        fields = self._search_fields.pop(name, ())
+        for gram in set().union(*map(_grams, fields)):
+            names = self._gram_index.get(gram)
+            if names is not None:
+                names.discard(name)
+                if not names:
+                    del self._gram_index[gram]
+    
     def _extract_parameters(self, callable_obj: Union[Callable, Type[BaseTool]]) -> Dict[str, Any]:
         """Extract parameter information from a callable."""
-        parameters = {}
-        
         try:
-            if isinstance(callable_obj, type) and issubclass(callable_obj, BaseTool):
-                # BaseTool subclass - extract from args_schema if available
-                if hasattr(callable_obj, 'args_schema') and callable_obj.args_schema:
-                    schema = callable_obj.args_schema.schema()
-                    parameters = schema.get('properties', {})
-            else:
-                # Regular function - use inspect
-                sig = inspect.signature(callable_obj)
-                for param_name, param in sig.parameters.items():
-                    param_info = {
-                        "type": str(param.annotation) if param.annotation != inspect.Parameter.empty else "Any",
-                        "required": param.default == inspect.Parameter.empty,
-                        "default": param.default if param.default != inspect.Parameter.empty else None
-                    }
-                    parameters[param_name] = param_info
-        
+            cached = _inspect_callable(callable_obj)
         except Exception as e:
             logger.warning(f"Could not extract parameters: {e}")
+            return {}
         
-        return parameters
+        # Copy so tools never share (and mutate) the cached entries
+        return {
+            name: dict(info) if isinstance(info, dict) else info
+            for name, info in cached.items()
+        }
     
     def _extract_description(self, callable_obj: Union[Callable, Type[BaseTool]]) -> str:
         """Extract description from a callable."""
@@ -168,7 +272,7 @@ class ToolRegistry:
         model_name: Optional[str] = None,
         category: Optional[str] = None,
         tags: Optional[List[str]] = None
-    ) -> List[ToolMetadata]:
+    ) -> Sequence[ToolMetadata]:
         """
         List tools with optional filtering.
         
@@ -178,23 +282,33 @@ class ToolRegistry:
             tags: Filter by tags (tools must have ALL specified tags)
             
         Returns:
-            List of matching tool metadata
+            Matching tool metadata; without filters this is a shared
+            snapshot and must not be mutated
         """
-        tools = list(self._tools.values())
-        
-        # Filter by model
-        if model_name:
-            tools = [t for t in tools if t.model_name == model_name]
+        if not (model_name or category or tags):
+            if self._all_tools_cache is None or self._all_tools_cache[0] != self._version:
+                self._all_tools_cache = (self._version, tuple(self._tools.values()))
+            return self._all_tools_cache[1]
         
-        # Filter by category
-        if category:
-            tools = [t for t in tools if t.category == category]
+        # Start from the narrowest index instead of the whole registry
+        if model_name and category:
+            in_category = self._categories.get(category, {})
+            names = [n for n in self._models.get(model_name, ()) if n in in_category]
+        elif model_name:
+            names = self._models.get(model_name, ())
+        elif category:
+            names = self._categories.get(category, ())
+        else:
+            names = self._tools.keys()
         
         # Filter by tags
         if tags:
-            tools = [t for t in tools if all(tag in t.tags for tag in tags)]
+            tagged = set(self._tags.get(tags[0], ()))
+            for tag in tags[1:]:
+                tagged &= self._tags.get(tag, set())
+            names = [n for n in names if n in tagged]
         
-        return tools
+        return [self._tools[n] for n in names]
     
     def list_categories(self) -> List[str]:
         """List all available categories."""
@@ -206,18 +320,47 @@ class ToolRegistry:
     
     def get_tools_by_category(self, category: str) -> List[ToolMetadata]:
         """Get all tools in a specific category."""
-        tool_names = self._categories.get(category, [])
-        return [self._tools[name] for name in tool_names if name in self._tools]
+        return [self._tools[name] for name in self._categories.get(category, ())]
     
     def get_tools_by_model(self, model_name: str) -> List[ToolMetadata]:
         """Get all tools from a specific model."""
-        tool_names = self._models.get(model_name, [])
-        return [self._tools[name] for name in tool_names if name in self._tools]
+        return [self._tools[name] for name in self._models.get(model_name, ())]
+    
+    def _index_summary(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Build (once per registry version) per-model and per-category summaries."""
+        if self._summary_cache is not None and self._summary_cache[0] == self._version:
+            return self._summary_cache[1]
+        
+        models = {}
+        for model_name, names in self._models.items():
+            categories = dict.fromkeys(self._tools[name].category for name in names)
+            models[model_name] = {"tools_count": len(names), "categories": list(categories)}
+        
+        categories = {}
+        for category, names in self._categories.items():
+            model_names = dict.fromkeys(self._tools[name].model_name for name in names)
+            categories[category] = {"tools_count": len(names), "models": list(model_names)}
+        
+        summary = {"models": models, "categories": categories}
+        self._summary_cache = (self._version, summary)
+        return summary
+    
+    def get_model_summary(self) -> Dict[str, Dict[str, Any]]:
+        """Get tool count and categories for each model (read-only)."""
+        return self._index_summary()["models"]
+    
+    def get_category_summary(self) -> Dict[str, Dict[str, Any]]:
+        """Get tool count and providing models for each category (read-only)."""
+        return self._index_summary()["categories"]
     
     def search_tools(self, query: str) -> List[ToolMetadata]:
         """
         Search tools by name, description, or tags.
         
+        A tool matches when the query is a case-insensitive substring of its
+        name, description or one of its tags. Tools sharing every trigram of
+        the query are looked up in an index and only those are checked.
+        
         Args:
             query: Search query
             
@@ -225,25 +368,26 @@ class ToolRegistry:
             List of matching tools
         """
         query_lower = query.lower()
-        matches = []
         
-        for tool in self._tools.values():
-            # Check name
-            if query_lower in tool.name.lower():
-                matches.append(tool)
-                continue
-            
-            # Check description
-            if query_lower in tool.description.lower():
-                matches.append(tool)
-                continue
-            
-            # Check tags
-            if any(query_lower in tag.lower() for tag in tool.tags):
-                matches.append(tool)
-                continue
+        candidates: Optional[Set[str]] = None
+        # Rarest trigrams first so the candidate set shrinks quickly
+        for gram in sorted(_grams(query_lower), key=lambda g: len(self._gram_index.get(g, ()))):
+            names = self._gram_index.get(gram)
+            if not names:
+                return []
+            candidates = set(names) if candidates is None else candidates & names
+            if not candidates:
+                return []
         
-        return matches
+        if candidates is None:
+            # Query shorter than a trigram
+            candidates = self._search_fields.keys()
+        matches = [
+            name for name in candidates
+            if any(query_lower in text for text in self._search_fields[name])
+        ]
+        matches.sort(key=self._search_order.__getitem__)
+        return [self._tools[name] for name in matches]
     
     def unregister_tool(self, name: str) -> bool:
         """
@@ -258,28 +402,36 @@ class ToolRegistry:
         if name not in self._tools:
             return False
         
-        tool = self._tools[name]
-        
         # Remove from main registry
-        del self._tools[name]
-        
-        # Remove from category index
-        if tool.category in self._categories:
-            if name in self._categories[tool.category]:
-                self._categories[tool.category].remove(name)
-            if not self._categories[tool.category]:
-                del self._categories[tool.category]
-        
-        # Remove from model index
-        if tool.model_name in self._models:
-            if name in self._models[tool.model_name]:
-                self._models[tool.model_name].remove(name)
-            if not self._models[tool.model_name]:
-                del self._models[tool.model_name]
+        tool = self._tools.pop(name)
+        self._remove_from_indexes(tool)
+        self._search_order.pop(name, None)
         
+        self._version += 1
         logger.info(f"Unregistered tool '{name}'")
         return True
     
+    def _remove_from_indexes(self, tool: ToolMetadata):
+        """Drop a tool from the category, model, tag and search indexes."""
+        name = tool.name
+        self._unindex_search(name)
+        
+        # Remove from category and model indexes
+        for index, key in ((self._categories, tool.category), (self._models, tool.model_name)):
+            names = index.get(key)
+            if names is not None:
+                names.pop(name, None)
+                if not names:
+                    del index[key]
+        
+        # Remove from tag index
+        for tag in tool.tags:
+            names = self._tags.get(tag)
+            if names is not None:
+                names.discard(name)
+                if not names:
+                    del self._tags[tag]
+    
     def unregister_model(self, model_name: str) -> int:
         """
         Unregister all tools from a specific model.
@@ -293,7 +445,7 @@ class ToolRegistry:
         if model_name not in self._models:
             return 0
         
-        tool_names = self._models[model_name].copy()
+        tool_names = list(self._models[model_name])
         count = 0
         
         for tool_name in tool_names:
@@ -305,28 +457,48 @@ class ToolRegistry:
     
     def get_registry_stats(self) -> Dict[str, Any]:
         """Get statistics about the tool registry."""
-        return {
+        if self._stats_cache is not None and self._stats_cache[0] == self._version:
+            return self._stats_cache[1]
+        
+        stats = {
             "total_tools": len(self._tools),
             "total_categories": len(self._categories),
             "total_models": len(self._models),
             "tools_by_category": {cat: len(tools) for cat, tools in self._categories.items()},
             "tools_by_model": {model: len(tools) for model, tools in self._models.items()}
         }
+        self._stats_cache = (self._version, stats)
+        return stats
     
     def export_registry(self) -> Dict[str, Any]:
-        """Export the entire registry as a dictionary."""
-        return {
-            "tools": {name: tool.to_dict() for name, tool in self._tools.items()},
-            "categories": self._categories,
-            "models": self._models,
+        """
+        Export the entire registry as a dictionary.
+        
+        The export is rebuilt only after the registry changes; treat the
+        returned dictionary as read-only.
+        """
+        if self._export_cache is not None and self._export_cache[0] == self._version:
+            return self._export_cache[1]
+        
+        export = {
+            "tools": {name: tool._as_dict() for name, tool in self._tools.items()},
+            "categories": {cat: list(names) for cat, names in self._categories.items()},
+            "models": {model: list(names) for model, names in self._models.items()},
             "stats": self.get_registry_stats()
         }
+        self._export_cache = (self._version, export)
+        return export
     
     def clear(self):
         """Clear the entire registry."""
         self._tools.clear()
         self._categories.clear()
         self._models.clear()
+        self._tags.clear()
+        self._gram_index.clear()
+        self._search_fields.clear()
+        self._search_order.clear()
+        self._version += 1
         logger.info("Cleared tool registry")
 
 
@@ -3,20 +3,97 @@ MCP SDK
 
 Software Development Kit for interacting with the Model Control Plane.
 Provides convenient classes and functions for developers.
+
+Clients share pooled HTTP sessions that outlive ``async with MCPClient()``;
+long-lived applications must ``await close_sessions()`` before their event
+loop ends. The module-level helpers close their session themselves.
 """
 
 import asyncio
 import json
 import logging
-from typing import Any, Dict, List, Optional, Union
+import random
+import shutil
+import tempfile
+import time
+import weakref
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import aiohttp
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - optional speedup
+    from json import loads as json_loads
+
 from .core.base_model import ModelResult, ModelStatus
 from .core.tool_registry import ToolMetadata
 
 logger = logging.getLogger(__name__)
 
+# Shared sessions keyed by event loop and base URL, so clients reuse
+# keep-alive connections instead of paying a new TCP/TLS handshake per client.
+# Sessions are bound to the loop that created them, so each loop has its own.
+_SESSIONS: Dict[asyncio.AbstractEventLoop, Dict[str, aiohttp.ClientSession]] = {}
+
+# Transient failures worth retrying with backoff
+_RETRY_STATUSES = {502, 503, 504}
+_MAX_RETRIES = 3
+
+# Last tool listing per (base URL, filters) with its ETag, for conditional GETs
+_TOOLS_CACHE: Dict[Tuple, Tuple[str, List[Dict[str, Any]]]] = {}
+
+
+class MCPHTTPError(Exception):
+    """Error response from the MCP server."""
+    
+    def __init__(self, status: int, message: str):
+        super().__init__(f"HTTP {status}: {message}")
+        self.status = status
+        self.message = message
+
+
+async def _raise_for_status(response: aiohttp.ClientResponse):
+    """Raise MCPHTTPError for a 4xx/5xx response."""
+    if response.status >= 400:
+        raise MCPHTTPError(response.status, await response.text())
+
+
+def _get_session(base_url: str) -> aiohttp.ClientSession:
+    """Return the pooled session for a server, creating it if needed."""
+    loop = asyncio.get_running_loop()
+    sessions = _SESSIONS.get(loop)
+    if sessions is None:
+        # Forget loops that have been closed; their connections died with them
+        for stale in [stale for stale in _SESSIONS if stale.is_closed()]:
+            del _SESSIONS[stale]
+        sessions = _SESSIONS[loop] = {}
+    
+    session = sessions.get(base_url)
+    if session is not None and not session.closed:
+        return session
+    
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=30,
+            keepalive_timeout=75,
+            ttl_dns_cache=300
+        )
+    )
+    sessions[base_url] = session
+    return session
+
+
+async def close_sessions():
+    """Close the running loop's pooled sessions (call on application shutdown)."""
+    sessions = _SESSIONS.pop(asyncio.get_running_loop(), {})
+    for session in sessions.values():
+        if not session.closed:
+            await session.close()
+
 
 class MCPClient:
     """
@@ -34,13 +111,21 @@ class MCPClient:
     
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession()
+        self.session = _get_session(self.base_url)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self.session:
-            await self.session.close()
+        # The session is shared with other clients; use aclose() or
+        # close_sessions() on shutdown
+        self.session = None
+    
+    async def aclose(self):
+        """Close the pooled session for this client's server."""
+        session = _SESSIONS.get(asyncio.get_running_loop(), {}).pop(self.base_url, None)
+        if session is not None and not session.closed:
+            await session.close()
+        self.session = None
     
     async def _request(
         self, 
@@ -48,22 +133,63 @@ class MCPClient:
         endpoint: str, 
         **kwargs
     ) -> Dict[str, Any]:
-        """Make HTTP request to MCP server."""
-        if not self.session:
-            self.session = aiohttp.ClientSession()
+        """
+        Make HTTP request to MCP server.
+        
+        Connection failures, timeouts and 502/503/504 responses are retried
+        with jittered exponential backoff. POST requests are only retried
+        when the connection could not be established, so a tool is never
+        submitted twice. aiohttp errors are raised with their original type;
+        other error responses raise MCPHTTPError.
+        """
+        if not self.session or self.session.closed:
+            self.session = _get_session(self.base_url)
         
         url = f"{self.base_url}{endpoint}"
+        idempotent = method.upper() != "POST"
         
-        try:
-            async with self.session.request(method, url, **kwargs) as response:
-                if response.status >= 400:
-                    error_text = await response.text()
-                    raise Exception(f"HTTP {response.status}: {error_text}")
-                
-                return await response.json()
+        for attempt in range(_MAX_RETRIES):
+            last_attempt = attempt == _MAX_RETRIES - 1
+            try:
+                async with self.session.request(method, url, **kwargs) as response:
+                    if response.status in _RETRY_STATUSES and idempotent and not last_attempt:
+                        logger.debug(f"{method} {endpoint} returned {response.status}, retrying")
+                    else:
+                        await _raise_for_status(response)
+                        return json_loads(await response.read())
+            
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                retryable = idempotent or isinstance(e, aiohttp.ClientConnectorError)
+                if last_attempt or not retryable:
+                    raise
+                logger.debug(f"{method} {endpoint} failed ({e!r}), retrying")
+            
+            await asyncio.sleep(2 ** attempt * 0.1 + random.random() * 0.1)
+    
+    async def _get_conditional(
+        self,
+        endpoint: str,
+        etag: Optional[str],
+        **kwargs
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Make a GET request with If-None-Match.
         
-        except aiohttp.ClientError as e:
-            raise Exception(f"Request failed: {e}")
+        Returns:
+            (etag, body) tuple; body is None when the server answers 304
+        """
+        if not self.session or self.session.closed:
+            self.session = _get_session(self.base_url)
+        
+        url = f"{self.base_url}{endpoint}"
+        headers = {"If-None-Match": etag} if etag else None
+        
+        async with self.session.get(url, headers=headers, **kwargs) as response:
+            if response.status == 304:
+                return etag, None
+            await _raise_for_status(response)
+            
+            return response.headers.get("ETag"), json_loads(await response.read())
     
     async def health_check(self) -> Dict[str, Any]:
         """Check MCP server health."""
@@ -81,8 +207,18 @@ class MCPClient:
         if category:
             params["category"] = category
         
-        response = await self._request("GET", "/tools", params=params)
-        return response["tools"]
+        # Revalidate the previous listing instead of downloading it again
+        key = (self.base_url, tuple(sorted(params.items())))
+        cached = _TOOLS_CACHE.get(key)
+        etag, response = await self._get_conditional(
+            "/tools", cached[0] if cached else None, params=params
+        )
+        if response is None:
+            return list(cached[1])
+        
+        if etag:
+            _TOOLS_CACHE[key] = (etag, response["tools"])
+        return list(response["tools"])
     
     async def get_tool_info(self, tool_name: str) -> Dict[str, Any]:
         """Get detailed information about a tool."""
@@ -139,15 +275,68 @@ class MCPClient:
         """
         Wait for execution to complete.
         
+        The server pushes the final status over a WebSocket; polling is only
+        used when the WebSocket cannot be opened or closes without a status.
+        Either way a failed execution is returned as its status, and an
+        unknown execution raises MCPHTTPError(404). Large results the server
+        only returns as ``result_url`` are downloaded into ``"result"``.
+        
         Args:
             execution_id: Execution ID to monitor
-            poll_interval: Polling interval in seconds
+            poll_interval: Polling interval in seconds (fallback only)
             timeout: Maximum wait time in seconds
             
         Returns:
             Final execution result
         """
-        start_time = asyncio.get_event_loop().time()
+        try:
+            async with asyncio.timeout(timeout):
+                status = await self._watch_execution(execution_id)
+        except TimeoutError:
+            raise TimeoutError(f"Execution {execution_id} timed out after {timeout} seconds")
+        except aiohttp.ClientError as e:
+            logger.debug(f"Status push unavailable for {execution_id}, polling instead: {e}")
+            status = None
+        
+        if status is None:
+            status = await self._poll_for_completion(execution_id, poll_interval, timeout)
+        
+        if "result_url" in status:
+            status["result"] = await self._download_result(status["result_url"])
+        return status
+    
+    async def _watch_execution(self, execution_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Wait for the server to push an execution's final status.
+        
+        Returns None if the socket closed or sent something other than a
+        status message, so the caller can poll instead.
+        """
+        if not self.session or self.session.closed:
+            self.session = _get_session(self.base_url)
+        
+        ws_url = f"{self.base_url}/ws/status/{execution_id}".replace("http", "ws", 1)
+        async with self.session.ws_connect(ws_url) as ws:
+            message = await ws.receive()
+        
+        if message.type != aiohttp.WSMsgType.TEXT:
+            logger.debug(f"Status push for {execution_id} ended with {message.type!r}")
+            return None
+        
+        status = json_loads(message.data)
+        # Statuses always carry "status"; the not-found reply only has "error"
+        if "status" not in status:
+            raise MCPHTTPError(404, status.get("error", f"Execution '{execution_id}' not found"))
+        return status
+    
+    async def _poll_for_completion(
+        self,
+        execution_id: str,
+        poll_interval: float,
+        timeout: Optional[float]
+    ) -> Dict[str, Any]:
+        """Poll the status endpoint until an execution finishes."""
+        start_time = time.monotonic()
         
         while True:
             status = await self.get_execution_status(execution_id)
@@ -156,7 +345,7 @@ class MCPClient:
                 return status
             
             # Check timeout
-            if timeout and (asyncio.get_event_loop().time() - start_time) > timeout:
+            if timeout and (time.monotonic() - start_time) > timeout:
                 raise TimeoutError(f"Execution {execution_id} timed out after {timeout} seconds")
             
             await asyncio.sleep(poll_interval)
@@ -165,6 +354,32 @@ class MCPClient:
         """Get execution status."""
         return await self._request("GET", f"/status/{execution_id}")
     
+    async def get_result(self, execution_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the result of a finished execution.
+        
+        Large results are not embedded in status responses; they are
+        downloaded in chunks from the URL the server returns instead.
+        """
+        status = await self.get_execution_status(execution_id)
+        if "result_url" not in status:
+            return status.get("result")
+        return await self._download_result(status["result_url"])
+    
+    async def _download_result(self, result_url: str) -> Any:
+        """Download a large result from the URL given in its status."""
+        if not self.session or self.session.closed:
+            self.session = _get_session(self.base_url)
+        
+        body = bytearray()
+        async with self.session.get(f"{self.base_url}{result_url}") as response:
+            await _raise_for_status(response)
+            
+            async for chunk in response.content.iter_chunked(64 * 1024):
+                body.extend(chunk)
+        
+        return json_loads(bytes(body))
+    
     async def cancel_execution(self, execution_id: str) -> Dict[str, Any]:
         """Cancel an execution."""
         return await self._request("DELETE", f"/executions/{execution_id}")
@@ -281,6 +496,47 @@ class ToolExecutor:
         )
 
 
+class BatchResults(Mapping):
+    """
+    Read-only mapping of execution name to result for a finished batch.
+    
+    Successful results live in JSON files and are loaded from disk on each
+    access, so a batch never holds every result in memory at once. Error
+    results are small and kept inline. The files are removed when this
+    object is garbage collected or ``cleanup()`` is called.
+    """
+    
+    def __init__(self, entries: Dict[str, Dict[str, Any]], tmp_dir: Optional[Path]):
+        self._entries = entries
+        self._tmp_dir = tmp_dir
+        self._finalizer = (
+            weakref.finalize(self, shutil.rmtree, tmp_dir, True)
+            if tmp_dir is not None else None
+        )
+    
+    def __getitem__(self, name: str) -> Any:
+        entry = self._entries[name]
+        result_path = entry.get("result_path")
+        if result_path is None:
+            return entry["result"]
+        return json_loads(Path(result_path).read_bytes())
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def status(self, name: str) -> str:
+        """Return an execution's final status without loading its result."""
+        return self._entries[name]["status"]
+    
+    def cleanup(self):
+        """Delete the result files now instead of at garbage collection."""
+        if self._finalizer is not None:
+            self._finalizer()
+
+
 class BatchExecutor:
     """
     Execute multiple tools in batch with dependency management.
@@ -289,6 +545,7 @@ class BatchExecutor:
     def __init__(self, client: MCPClient):
         self.client = client
         self.executions: Dict[str, Dict[str, Any]] = {}
+        self._tmp_dir: Optional[Path] = None
     
     def add_execution(
         self,
@@ -306,48 +563,154 @@ class BatchExecutor:
             "priority": priority,
             "status": "pending",
             "execution_id": None,
-            "result": None
+            "result": None,
+            "result_path": None
         }
     
-    async def execute_batch(self, max_concurrent: int = 3) -> Dict[str, Any]:
-        """Execute the batch with dependency resolution."""
-        semaphore = asyncio.Semaphore(max_concurrent)
-        results = {}
+    def _dependency_graph(self) -> Tuple[Dict[str, int], Dict[str, List[str]]]:
+        """Return each execution's number of dependencies and its dependents."""
+        indegree = {name: 0 for name in self.executions}
+        dependents: Dict[str, List[str]] = {name: [] for name in self.executions}
+        for name, execution in self.executions.items():
+            for dep_name in execution["depends_on"]:
+                if dep_name in self.executions:
+                    indegree[name] += 1
+                    dependents[dep_name].append(name)
+        return indegree, dependents
+    
+    def _check_acyclic(self):
+        """Raise ValueError if the dependencies contain a cycle (Kahn's algorithm)."""
+        indegree, dependents = self._dependency_graph()
+        
+        ready = [name for name, degree in indegree.items() if degree == 0]
+        visited = 0
+        while ready:
+            name = ready.pop()
+            visited += 1
+            for dependent in dependents[name]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    ready.append(dependent)
+        
+        if visited < len(self.executions):
+            cyclic = sorted(name for name, degree in indegree.items() if degree > 0)
+            raise ValueError(f"Dependency cycle between executions: {cyclic}")
+    
+    async def execute_batch(self, max_concurrent: int = 3) -> BatchResults:
+        """
+        Execute the batch with dependency resolution.
+        
+        A fixed pool of ``max_concurrent`` workers takes executions from a
+        ready queue; an execution is queued once all of its dependencies
+        have finished. Successful results are written to a temporary
+        directory rather than kept in ``self.executions``.
+        
+        Returns:
+            BatchResults mapping each execution name to its result
+        
+        Raises:
+            ValueError: If the executions depend on each other in a cycle
+        """
+        self._check_acyclic()
+        
+        # name -> {"status", "duration", and either "result" or "result_path"}
+        results: Dict[str, Dict[str, Any]] = {}
+        if not self.executions:
+            return BatchResults(results, None)
+        
+        self._tmp_dir = Path(tempfile.mkdtemp(prefix="mcp_batch_"))
+        
+        indegree, dependents = self._dependency_graph()
+        ready: asyncio.Queue = asyncio.Queue()
+        remaining = len(self.executions)
+        all_done = asyncio.Event()
         
         async def execute_single(name: str):
-            async with semaphore:
-                execution = self.executions[name]
+            execution = self.executions[name]
+            
+            failed_deps = [
+                dep_name for dep_name in execution["depends_on"]
+                if dep_name in self.executions
+                and self.executions[dep_name]["status"] != "completed"
+            ]
+            if failed_deps:
+                execution["status"] = "failed"
+                execution["result"] = {"error": f"Dependencies failed: {failed_deps}"}
+                results[name] = {"status": "failed", "result": execution["result"]}
+                return
+            
+            # Execute tool
+            start = time.monotonic()
+            try:
+                execution["status"] = "running"
+                result = await self.client.execute_tool(
+                    execution["tool_name"],
+                    execution["parameters"],
+                    execution["priority"],
+                    wait_for_completion=True
+                )
+                
+                # Results can be several MB each, keep them on disk
+                result_path = self._tmp_dir / f"{name}.json"
+                await asyncio.to_thread(
+                    result_path.write_text, json.dumps(result, default=str)
+                )
+                del result
                 
-                # Wait for dependencies
-                for dep_name in execution["depends_on"]:
-                    if dep_name in self.executions:
-                        while self.executions[dep_name]["status"] != "completed":
-                            await asyncio.sleep(0.5)
+                execution["status"] = "completed"
+                execution["result_path"] = str(result_path)
+                results[name] = {
+                    "status": "completed",
+                    "duration": time.monotonic() - start,
+                    "result_path": str(result_path)
+                }
                 
-                # Execute tool
+            except Exception as e:
+                execution["status"] = "failed"
+                execution["result"] = {"error": str(e)}
+                results[name] = {
+                    "status": "failed",
+                    "duration": time.monotonic() - start,
+                    "result": execution["result"]
+                }
+        
+        def finish(name: str):
+            nonlocal remaining
+            remaining -= 1
+            for dependent in dependents[name]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    ready.put_nowait(dependent)
+            if remaining == 0:
+                all_done.set()
+        
+        async def worker():
+            while True:
+                name = await ready.get()
                 try:
-                    execution["status"] = "running"
-                    result = await self.client.execute_tool(
-                        execution["tool_name"],
-                        execution["parameters"],
-                        execution["priority"],
-                        wait_for_completion=True
-                    )
-                    
-                    execution["status"] = "completed"
-                    execution["result"] = result
-                    results[name] = result
-                    
-                except Exception as e:
-                    execution["status"] = "failed"
-                    execution["result"] = {"error": str(e)}
-                    results[name] = execution["result"]
-        
-        # Execute all tasks
-        tasks = [execute_single(name) for name in self.executions.keys()]
-        await asyncio.gather(*tasks)
-        
-        return results
+                    await execute_single(name)
+                finally:
+                    finish(name)
+        
+        for name, degree in indegree.items():
+            if degree == 0:
+                ready.put_nowait(name)
+        
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(max_concurrent, len(self.executions)))
+        ]
+        try:
+            await all_done.wait()
+        except BaseException:
+            shutil.rmtree(self._tmp_dir, ignore_errors=True)
+            raise
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        
+        return BatchResults(results, self._tmp_dir)
 
 
 # Utility functions
@@ -357,20 +720,26 @@ async def quick_execute(
     server_url: str = "http://localhost:8000"
 ) -> Dict[str, Any]:
     """Quick tool execution with automatic client management."""
-    async with MCPClient(server_url) as client:
+    client = MCPClient(server_url)
+    try:
         return await client.execute_tool(
             tool_name, 
             parameters, 
             wait_for_completion=True
         )
+    finally:
+        await client.aclose()
 
 
 async def list_available_tools(
     server_url: str = "http://localhost:8000"
 ) -> List[Dict[str, Any]]:
     """List all available tools."""
-    async with MCPClient(server_url) as client:
+    client = MCPClient(server_url)
+    try:
         return await client.list_tools()
+    finally:
+        await client.aclose()
 
 
 # Example usage functions
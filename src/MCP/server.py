@@ -6,30 +6,54 @@ Provides REST API endpoints for model management and execution.
 """
 
 import asyncio
+import functools
+import json
 import logging
+import os
+import tempfile
+import time
+import uuid
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse, Response
+from pydantic import BaseModel, ConfigDict, ValidationError
 
 from .core.router import mcp_router
 from .core.tool_registry import tool_registry
 from .core.environment_manager import environment_manager
+from .sdk import close_sessions
 from .adapters.climada_adapter import ClimadaAdapter
 from .adapters.lisflood_adapter import LisfloodAdapter
 from .tools.climada_tools import get_climada_tools
 from .tools.lisflood_tools import get_lisflood_tools
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # pragma: no cover - optional shared cache
+    aioredis = None
+
 logger = logging.getLogger(__name__)
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Model Control Plane (MCP) Server",
     description="REST API for managing and executing scientific models",
-    version="1.0.0"
+    version="1.0.0",
+    # orjson encodes the registry/stats payloads several times faster
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse
 )
+_ResponseClass = ORJSONResponse if orjson is not None else JSONResponse
 
 # Add CORS middleware
 app.add_middleware(
@@ -42,6 +66,8 @@ app.add_middleware(
 
 # Request/Response models
 class ToolExecutionRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
     tool_name: str
     parameters: Dict[str, Any]
     priority: Optional[int] = 0
@@ -59,6 +85,248 @@ class ModelRegistrationRequest(BaseModel):
 # Global state
 _models_initialized = False
 
+# Response timestamp, refreshed once a second by a background task instead
+# of formatting a new datetime on every request
+_now_iso = datetime.now().isoformat()
+_clock_task: Optional[asyncio.Task] = None
+
+async def _refresh_now():
+    """Keep ``_now_iso`` current to within a second."""
+    global _now_iso
+    while True:
+        await asyncio.sleep(1)
+        _now_iso = datetime.now().isoformat()
+
+# Finished execution statuses (oldest evicted first) and completion events
+# for executions still in flight, so status watchers are pushed the result
+_MAX_FINISHED_EXECUTIONS = 1000
+_finished_executions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_execution_events: Dict[str, asyncio.Event] = {}
+_running_tasks: Dict[str, asyncio.Task] = {}
+
+# Results larger than this are written to disk and served from /results
+# instead of being held in memory and embedded in every status response
+_LARGE_RESULT_BYTES = 1024 * 1024
+_RESULTS_DIR = Path(tempfile.gettempdir()) / "mcp_results"
+_result_files: Dict[str, Path] = {}
+
+def _json_bytes(value: Any) -> bytes:
+    """Serialize a value to JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(value, default=str, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(value, default=str).encode()
+
+def _write_result_file(path: Path, body: bytes):
+    """Write a serialized result to disk."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(body)
+
+def _forget_finished(execution_id: str):
+    """Drop a finished execution's status and any result file."""
+    _finished_executions.pop(execution_id, None)
+    path = _result_files.pop(execution_id, None)
+    if path is not None:
+        path.unlink(missing_ok=True)
+
+# Response caching applies only to QUERY endpoints (GETs listed here, with
+# their TTL in seconds); COMMAND endpoints (POST/DELETE) are never cached and
+# invalidate the queries they affect instead
+_CACHE_POLICY: Dict[str, float] = {
+    "/tools": 10,
+    "/tools/{tool_name}": 30,
+    "/models": 30,
+    "/categories": 60,
+    "/stats": 2,
+    "/environments": 60,
+}
+
+# key -> (expires_at, JSON bytes), least recently used first
+_MAX_CACHED_RESPONSES = 512
+_response_cache: "OrderedDict[Tuple, Tuple[float, bytes]]" = OrderedDict()
+_last_health: Optional[Dict[str, Any]] = None
+
+# Optional Redis cache shared by every server process (MCP_CACHE_URL); the
+# in-process dict above is used when it is unset or unreachable
+_CACHE_URL = os.getenv("MCP_CACHE_URL")
+# Short socket timeouts so an unreachable Redis degrades to the local cache
+# instead of stalling requests; after a failure Redis is skipped for a while
+_REDIS_TIMEOUT = 0.25  # seconds
+_REDIS_RETRY_AFTER = 30.0  # seconds
+_redis = (
+    aioredis.from_url(
+        _CACHE_URL,
+        socket_connect_timeout=_REDIS_TIMEOUT,
+        socket_timeout=_REDIS_TIMEOUT
+    )
+    if aioredis is not None and _CACHE_URL else None
+)
+_redis_down_until = 0.0
+
+def _shared_cache_enabled() -> bool:
+    """Whether Redis is configured and not in its back-off period."""
+    return _redis is not None and time.monotonic() >= _redis_down_until
+
+def _shared_cache_failed(error: Exception):
+    """Use only the local cache for a while after a Redis error."""
+    global _redis_down_until
+    _redis_down_until = time.monotonic() + _REDIS_RETRY_AFTER
+    logger.warning(
+        f"Shared response cache unavailable, local cache only for {_REDIS_RETRY_AFTER:.0f}s: {error}"
+    )
+
+def _generation_key(path: str) -> str:
+    """Redis counter bumped to invalidate every shared entry for a path."""
+    return f"mcp:response-gen:{path}"
+
+async def _shared_cache_key(key: Tuple) -> Optional[str]:
+    """
+    Build the Redis key for a local cache key, or None if Redis is unreachable.
+    
+    The key embeds the path's current generation, so invalidating a path is a
+    single INCR; entries of older generations simply expire.
+    """
+    try:
+        generation = await _redis.get(_generation_key(key[0]))
+    except Exception as e:
+        _shared_cache_failed(e)
+        return None
+    generation = int(generation or 0)
+    return f"mcp:response:{key[0]}:{generation}:{key[1]}:{key[2]!r}"
+
+async def _shared_cache_get(shared_key: str) -> Optional[Tuple[bytes, float]]:
+    """Read a response body and its remaining TTL in seconds from Redis, or None."""
+    try:
+        async with _redis.pipeline(transaction=False) as pipe:
+            body, ttl_ms = await pipe.get(shared_key).pttl(shared_key).execute()
+    except Exception as e:
+        _shared_cache_failed(e)
+        return None
+    if body is None or ttl_ms <= 0:
+        return None
+    return body, ttl_ms / 1000
+
+async def _shared_cache_set(shared_key: str, body: bytes, ttl: float):
+    """Store a response body in Redis, ignoring errors."""
+    try:
+        await _redis.set(shared_key, body, px=int(ttl * 1000))
+    except Exception as e:
+        _shared_cache_failed(e)
+
+def _cache_store(key: Tuple, expires_at: float, body: bytes):
+    """Store a response body locally, evicting the least recently used entries."""
+    _response_cache[key] = (expires_at, body)
+    _response_cache.move_to_end(key)
+    while len(_response_cache) > _MAX_CACHED_RESPONSES:
+        _response_cache.popitem(last=False)
+
+def cacheable(path: str):
+    """
+    Cache a QUERY endpoint's response for the TTL in ``_CACHE_POLICY``.
+    
+    Entries are keyed by path, parameters and the tool registry version, so
+    registering or removing tools invalidates them. Bodies are stored
+    encoded, in Redis when configured and in process otherwise. Responses
+    report ``X-Cache: HIT`` or ``MISS``.
+    """
+    ttl = _CACHE_POLICY[path]
+    
+    def decorator(func: Callable):
+        @functools.wraps(func)
+        async def wrapper(**kwargs):
+            key = (path, tool_registry.version, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            entry = _response_cache.get(key)
+            if entry is not None and now < entry[0]:
+                _response_cache.move_to_end(key)
+                return Response(entry[1], media_type="application/json", headers={"X-Cache": "HIT"})
+            
+            # The generation is read before computing, so an invalidation that
+            # lands meanwhile makes this body unreachable instead of stale
+            shared_key = await _shared_cache_key(key) if _shared_cache_enabled() else None
+            if shared_key is not None and (shared := await _shared_cache_get(shared_key)) is not None:
+                # Expire locally when the shared entry does, not a full TTL later
+                body, remaining = shared
+                _cache_store(key, now + remaining, body)
+                return Response(body, media_type="application/json", headers={"X-Cache": "HIT"})
+            
+            # Drop the expired entry now in case the handler raises
+            _response_cache.pop(key, None)
+            body = _json_bytes(jsonable_encoder(await func(**kwargs)))
+            _cache_store(key, now + ttl, body)
+            if shared_key is not None:
+                await _shared_cache_set(shared_key, body, ttl)
+            return Response(body, media_type="application/json", headers={"X-Cache": "MISS"})
+        return wrapper
+    return decorator
+
+async def _invalidate(*paths: str):
+    """Drop cached responses for the given QUERY paths."""
+    for key in [key for key in _response_cache if key[0] in paths]:
+        del _response_cache[key]
+    
+    if _shared_cache_enabled():
+        try:
+            for path in paths:
+                await _redis.incr(_generation_key(path))
+        except Exception as e:
+            _shared_cache_failed(e)
+
+def _parameter_model(tool_name: str) -> Optional[type]:
+    """Return the pydantic model describing a tool's parameters, if it has one."""
+    tool = tool_registry.get_tool(tool_name)
+    if tool is None:
+        return None
+    
+    args_schema = getattr(tool.callable_obj, "args_schema", None)
+    if isinstance(args_schema, type) and issubclass(args_schema, BaseModel):
+        return args_schema
+    return None
+
+async def _run_execution(request: ToolExecutionRequest, execution_id: str):
+    """Run a tool through the router and publish its final status."""
+    event = _execution_events.setdefault(execution_id, asyncio.Event())
+    try:
+        result = await mcp_router.execute_tool(
+            tool_name=request.tool_name,
+            parameters=request.parameters,
+            execution_id=execution_id,
+            priority=request.priority
+        )
+        status = {
+            "execution_id": execution_id,
+            "status": result.status.value,
+            "result": result.to_dict()
+        }
+        body = await asyncio.to_thread(_json_bytes, status["result"])
+        if len(body) > _LARGE_RESULT_BYTES:
+            # File names are random so request-supplied tool names never reach the path
+            path = _RESULTS_DIR / f"{uuid.uuid4().hex}.json"
+            await asyncio.to_thread(_write_result_file, path, body)
+            _result_files[execution_id] = path
+            del status["result"]
+            status["result_url"] = f"/results/{execution_id}.json"
+        
+        _finished_executions[execution_id] = status
+        return result
+    except asyncio.CancelledError:
+        _finished_executions[execution_id] = {
+            "execution_id": execution_id,
+            "status": "cancelled"
+        }
+        raise
+    except Exception as e:
+        logger.error(f"Execution '{execution_id}' failed: {e}")
+        _finished_executions[execution_id] = {
+            "execution_id": execution_id,
+            "status": "failed",
+            "error": str(e)
+        }
+    finally:
+        while len(_finished_executions) > _MAX_FINISHED_EXECUTIONS:
+            _forget_finished(next(iter(_finished_executions)))
+        _execution_events.pop(execution_id, None)
+        event.set()
+
 async def initialize_models():
     """Initialize model adapters and register tools."""
     global _models_initialized
@@ -106,6 +374,7 @@ async def initialize_models():
             )
         
         _models_initialized = True
+        _response_cache.clear()
         logger.info("MCP models initialized successfully")
         
     except Exception as e:
@@ -116,45 +385,96 @@ async def initialize_models():
 @app.on_event("startup")
 async def startup_event():
     """Initialize the MCP server."""
+    global _clock_task, _now_iso
+    _now_iso = datetime.now().isoformat()
+    _clock_task = asyncio.create_task(_refresh_now())
+    await environment_manager.start()
     await initialize_models()
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background tasks and release pooled HTTP and Redis connections."""
+    if _clock_task is not None:
+        _clock_task.cancel()
+    await close_sessions()
+    if _redis is not None:
+        await _redis.aclose()
+
+# Distinguishes ETags across restarts, where the registry version starts over
+_BOOT_ID = uuid.uuid4().hex[:12]
+
+@app.middleware("http")
+async def tool_metadata_etag(request: Request, call_next):
+    """Answer conditional GETs for tool metadata from the registry version."""
+    if request.method != "GET" or not request.url.path.startswith("/tools"):
+        return await call_next(request)
+    
+    # Tool metadata only changes when the registry does
+    etag = f'W/"reg-{_BOOT_ID}-{tool_registry.version}"'
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    response = await call_next(request)
+    if response.status_code == 200:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "max-age=30"
+    return response
+
 # API Endpoints
 
+# The root response only changes with the timestamp: encode it once with a
+# placeholder, and splice the current timestamp in (at most once a second)
+_ROOT_TEMPLATE = _json_bytes({
+    "name": "Model Control Plane (MCP) Server",
+    "version": "1.0.0",
+    "status": "operational",
+    "timestamp": "__TS__",
+    "endpoints": {
+        "tools": "/tools",
+        "execute": "/execute",
+        "status": "/status",
+        "models": "/models",
+        "health": "/health"
+    }
+}).replace(b'"__TS__"', b"__TS__")
+_root_body: Tuple[str, bytes] = ("", b"")
+
 @app.get("/")
 async def root():
     """Root endpoint with server information."""
-    return {
-        "name": "Model Control Plane (MCP) Server",
-        "version": "1.0.0",
-        "status": "operational",
-        "timestamp": datetime.now().isoformat(),
-        "endpoints": {
-            "tools": "/tools",
-            "execute": "/execute",
-            "status": "/status",
-            "models": "/models",
-            "health": "/health"
-        }
-    }
+    global _root_body
+    
+    if _root_body[0] != _now_iso:
+        _root_body = (_now_iso, _ROOT_TEMPLATE.replace(b"__TS__", _json_bytes(_now_iso)))
+    return Response(content=_root_body[1], media_type="application/json")
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
+    global _last_health
+    
     try:
         health_results = await mcp_router.health_check()
         env_list = await environment_manager.list_environments()
         
-        return {
+        _last_health = jsonable_encoder({
             "status": "healthy",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso,
             "router": health_results,
             "environments": len(env_list),
             "tools_registered": len(tool_registry.list_tools())
-        }
+        })
+        return _last_health
     except Exception as e:
+        if _last_health is not None:
+            # Serve the last good report rather than failing the probe outright
+            logger.warning(f"Health check failed, serving stale result: {e}")
+            return _ResponseClass(content=_last_health, headers={"X-Cache": "STALE"})
         raise HTTPException(status_code=500, detail=f"Health check failed: {str(e)}")
 
 @app.get("/tools")
+@cacheable("/tools")
 async def list_tools(
     model_name: Optional[str] = None,
     category: Optional[str] = None
@@ -163,7 +483,7 @@ async def list_tools(
     try:
         tools = tool_registry.list_tools(model_name=model_name, category=category)
         return {
-            "tools": [tool.to_dict() for tool in tools],
+            "tools": [tool._as_dict() for tool in tools],
             "total_count": len(tools),
             "filter_applied": {
                 "model_name": model_name,
@@ -174,33 +494,44 @@ async def list_tools(
         raise HTTPException(status_code=500, detail=f"Failed to list tools: {str(e)}")
 
 @app.get("/tools/{tool_name}")
+@cacheable("/tools/{tool_name}")
 async def get_tool_info(tool_name: str):
     """Get detailed information about a specific tool."""
     tool = tool_registry.get_tool(tool_name)
     if not tool:
         raise HTTPException(status_code=404, detail=f"Tool '{tool_name}' not found")
     
-    return tool.to_dict()
+    return tool._as_dict()
 
 @app.post("/execute", response_model=ToolExecutionResponse)
-async def execute_tool(request: ToolExecutionRequest, background_tasks: BackgroundTasks):
+async def execute_tool(request: ToolExecutionRequest):
     """Execute a tool asynchronously."""
+    # Reject bad parameters now rather than after the run has been queued
+    params_model = _parameter_model(request.tool_name)
+    if params_model is not None:
+        try:
+            params_model.model_validate(request.parameters)
+        except ValidationError as e:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Invalid parameters for '{request.tool_name}': {e}"
+            )
+    
     try:
-        # Start execution in background
-        execution_id = f"exec_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{request.tool_name}"
+        execution_id = f"exec_{uuid.uuid4().hex[:12]}_{request.tool_name}"
         
-        # Execute tool through router
-        result = await mcp_router.execute_tool(
-            tool_name=request.tool_name,
-            parameters=request.parameters,
-            execution_id=execution_id,
-            priority=request.priority
-        )
+        # Start execution in background; progress is available from /status
+        # and /ws/status while the tool runs
+        _execution_events[execution_id] = asyncio.Event()
+        await _invalidate("/stats")
+        task = asyncio.create_task(_run_execution(request, execution_id))
+        _running_tasks[execution_id] = task
+        task.add_done_callback(lambda _: _running_tasks.pop(execution_id, None))
         
         return ToolExecutionResponse(
             execution_id=execution_id,
-            status=result.status.value,
-            message=f"Tool '{request.tool_name}' executed with status: {result.status.value}"
+            status="queued",
+            message=f"Tool '{request.tool_name}' queued for execution"
         )
         
     except Exception as e:
@@ -210,7 +541,12 @@ async def execute_tool(request: ToolExecutionRequest, background_tasks: Backgrou
 async def get_execution_status(execution_id: str):
     """Get the status of a specific execution."""
     try:
-        status = await mcp_router.get_execution_status(execution_id)
+        status = _finished_executions.get(execution_id)
+        if status is None:
+            status = await mcp_router.get_execution_status(execution_id)
+        if status is None and execution_id in _execution_events:
+            # Accepted but not yet picked up by the router
+            status = {"execution_id": execution_id, "status": "queued"}
         if not status:
             raise HTTPException(status_code=404, detail=f"Execution '{execution_id}' not found")
         
@@ -220,17 +556,54 @@ async def get_execution_status(execution_id: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get status: {str(e)}")
 
+@app.websocket("/ws/status/{execution_id}")
+async def watch_execution_status(websocket: WebSocket, execution_id: str):
+    """Push the final status of an execution once it finishes."""
+    await websocket.accept()
+    try:
+        event = _execution_events.get(execution_id)
+        if event is not None:
+            await event.wait()
+        
+        status = _finished_executions.get(execution_id)
+        if status is None:
+            await websocket.send_json(
+                {"execution_id": execution_id, "error": f"Execution '{execution_id}' not found"}
+            )
+            await websocket.close(code=4404)
+            return
+        
+        await websocket.send_json(status)
+        await websocket.close()
+    except WebSocketDisconnect:
+        pass
+
+@app.get("/results/{execution_id}.json")
+async def get_execution_result(execution_id: str):
+    """Download a large execution result stored on disk."""
+    path = _result_files.get(execution_id)
+    if path is None or not path.exists():
+        raise HTTPException(status_code=404, detail=f"No stored result for '{execution_id}'")
+    
+    return FileResponse(path, media_type="application/json")
+
 @app.delete("/executions/{execution_id}")
 async def cancel_execution(execution_id: str):
     """Cancel a queued or running execution."""
     try:
         cancelled = await mcp_router.cancel_execution(execution_id)
+        if not cancelled:
+            # Running executions are stopped by cancelling their task
+            task = _running_tasks.get(execution_id)
+            if task is not None and not task.done():
+                cancelled = task.cancel()
         if not cancelled:
             raise HTTPException(
                 status_code=404, 
                 detail=f"Execution '{execution_id}' not found or cannot be cancelled"
             )
         
+        await _invalidate("/stats")
         return {"message": f"Execution '{execution_id}' cancelled successfully"}
     except HTTPException:
         raise
@@ -238,18 +611,16 @@ async def cancel_execution(execution_id: str):
         raise HTTPException(status_code=500, detail=f"Failed to cancel execution: {str(e)}")
 
 @app.get("/models")
+@cacheable("/models")
 async def list_models():
     """List registered models."""
     try:
         models = mcp_router.list_models()
-        model_stats = {}
-        
-        for model_name in models:
-            tools = tool_registry.get_tools_by_model(model_name)
-            model_stats[model_name] = {
-                "tools_count": len(tools),
-                "categories": list(set(tool.category for tool in tools))
-            }
+        summary = tool_registry.get_model_summary()
+        model_stats = {
+            model_name: summary.get(model_name, {"tools_count": 0, "categories": []})
+            for model_name in models
+        }
         
         return {
             "models": model_stats,
@@ -259,27 +630,21 @@ async def list_models():
         raise HTTPException(status_code=500, detail=f"Failed to list models: {str(e)}")
 
 @app.get("/categories")
+@cacheable("/categories")
 async def list_categories():
     """List available tool categories."""
     try:
-        categories = tool_registry.list_categories()
-        category_stats = {}
-        
-        for category in categories:
-            tools = tool_registry.get_tools_by_category(category)
-            category_stats[category] = {
-                "tools_count": len(tools),
-                "models": list(set(tool.model_name for tool in tools))
-            }
+        category_stats = tool_registry.get_category_summary()
         
         return {
             "categories": category_stats,
-            "total_categories": len(categories)
+            "total_categories": len(category_stats)
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list categories: {str(e)}")
 
 @app.get("/environments")
+@cacheable("/environments")
 async def list_environments():
     """List available Conda environments."""
     try:
@@ -292,6 +657,7 @@ async def list_environments():
         raise HTTPException(status_code=500, detail=f"Failed to list environments: {str(e)}")
 
 @app.get("/stats")
+@cacheable("/stats")
 async def get_server_stats():
     """Get comprehensive server statistics."""
     try:
@@ -300,7 +666,7 @@ async def get_server_stats():
         environments = await environment_manager.list_environments()
         
         return {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso,
             "router": router_stats,
             "registry": registry_stats,
             "environments": len(environments),
@@ -311,4 +677,17 @@ async def get_server_stats():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    
+    # Prefer the libuv event loop and C HTTP parser when they are installed
+    try:
+        import uvloop  # noqa: F401
+        event_loop = "uvloop"
+    except ImportError:
+        event_loop = "asyncio"
+    try:
+        import httptools  # noqa: F401
+        http_impl = "httptools"
+    except ImportError:
+        http_impl = "h11"
+    
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop=event_loop, http=http_impl)
\ No newline at end of file
@@ -7,29 +7,153 @@ for starting, stopping, and monitoring all disaster model servers.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
 import os
 import signal
-import subprocess
 import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Set
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Parsed server configs, keyed by config path and validated by mtime/size
+CONFIG_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "mcp" / "server_configs"
+)
+# Server stdout/stderr are appended to <dir>/<server>.log
+SERVER_LOG_DIR = Path(os.environ.get("MCP_SERVER_LOG_DIR", "logs"))
+
+# Servers write "READY\n" to the pipe fd named here once they accept requests
+READY_FD_ENV = "MCP_READY_FD"
+READY_TIMEOUT = 10.0  # seconds
+
+# Bytes of a server's log shown when it fails to start
+_FAILED_START_LOG_BYTES = 4096
+
+# Servers written to a new config file; copied per manager so edits stay local
+_DEFAULT_SERVER_CONFIGS = MappingProxyType({
+    "climada": {
+        "module": "src.MCP.servers.climada_server",
+        "description": "CLIMADA climate risk assessment",
+        "port": 8001,
+        "environment": "climada",
+        "enabled": True,
+        "restart_on_failure": True
+    },
+    "lisflood": {
+        "module": "src.MCP.servers.lisflood_server",
+        "description": "LISFLOOD hydrological modeling",
+        "port": 8002,
+        "environment": "lisflood",
+        "enabled": True,
+        "restart_on_failure": True
+    },
+    "cell2fire": {
+        "module": "src.MCP.servers.cell2fire_server",
+        "description": "Cell2Fire wildfire simulation",
+        "port": 8003,
+        "environment": "cell2fire",
+        "enabled": True,
+        "restart_on_failure": True
+    },
+    "pangu": {
+        "module": "src.MCP.servers.pangu_server",
+        "description": "Pangu Weather forecasting",
+        "port": 8004,
+        "environment": "pangu",
+        "enabled": True,
+        "restart_on_failure": True
+    },
+    "aurora": {
+        "module": "src.MCP.servers.aurora_server",
+        "description": "Aurora atmospheric modeling",
+        "port": 8005,
+        "environment": "aurora",
+        "enabled": True,
+        "restart_on_failure": True
+    },
+    "nfdrs4": {
+        "module": "src.MCP.servers.nfdrs4_server",
+        "description": "NFDRS4 fire danger rating",
+        "port": 8006,
+        "environment": "nfdrs4",
+        "enabled": True,
+        "restart_on_failure": True
+    },
+    "filesystem": {
+        "module": "src.MCP.servers.filesystem_server",
+        "description": "Secure filesystem operations",
+        "port": 8007,
+        "environment": "base",
+        "enabled": True,
+        "restart_on_failure": True
+    },
+    "postgresql": {
+        "module": "src.MCP.servers.postgresql_server",
+        "description": "PostgreSQL database access",
+        "port": 8008,
+        "environment": "base",
+        "enabled": False,  # Requires database setup
+        "restart_on_failure": True
+    },
+    "combined": {
+        "module": "src.MCP.servers.combined_server",
+        "description": "Aurora and Cell2Fire in a single process",
+        "port": 8009,
+        "environment": "base",
+        "enabled": False,  # Enable instead of aurora and cell2fire on a single host
+        "restart_on_failure": True
+    }
+})
+
+# Manager-wide defaults, overridable per server for the restart settings
+_DEFAULT_GLOBAL_SETTINGS = MappingProxyType({
+    "log_level": "INFO",
+    "restart_delay": 5,
+    "max_restarts": 3
+})
+
+# A server that stays up this long gets its restart budget back
+RESTART_RESET_AFTER = 60.0  # seconds
+
+
+@dataclass(slots=True)
+class ServerState:
+    """A managed server process and its bookkeeping."""
+    
+    process: asyncio.subprocess.Process
+    started_at: float  # time.monotonic() when the process was spawned
+    restarts: int = 0  # automatic restarts after unexpected exits
+    # Task waiting for the process to exit, set once the server is ready
+    watcher: Optional[asyncio.Task] = field(default=None, repr=False)
+
 
 class MCPServerManager:
     """Manager for multiple MCP servers."""
     
     def __init__(self, config_file: Optional[str] = None):
         self.config_file = config_file or "mcp_servers.yaml"
-        self.servers: Dict[str, subprocess.Popen] = {}
+        self.servers: Dict[str, ServerState] = {}
         self.server_configs = {}
+        self.global_settings = dict(_DEFAULT_GLOBAL_SETTINGS)
+        # Digest of the config as last read from or written to disk
+        self._config_hash: Optional[bytes] = None
         self.running = False
+        self._stopped_event = asyncio.Event()
         
         # Load server configurations
         self._load_config()
@@ -40,9 +164,10 @@ class MCPServerManager:
         
         if config_path.exists():
             try:
-                with open(config_path, 'r') as f:
-                    config = yaml.safe_load(f)
+                config = self._read_config(config_path)
                 self.server_configs = config.get('servers', {})
+                self.global_settings.update(config.get('global_settings') or {})
+                self._config_hash = self._config_digest(self._dump_config())
                 logger.info(f"Loaded configuration for {len(self.server_configs)} servers")
             except Exception as e:
                 logger.error(f"Failed to load config file {config_path}: {e}")
@@ -51,92 +176,93 @@ class MCPServerManager:
             logger.info(f"Config file {config_path} not found, creating default")
             self._create_default_config()
     
+    def _read_config(self, config_path: Path) -> Dict[str, Any]:
+        """
+        Parse a YAML config file, reusing a JSON copy while it is unchanged.
+        
+        CLI actions such as ``status`` or ``stop`` start a fresh process each
+        time, so the parsed config is cached on disk rather than in memory.
+        The cache is plain JSON, so loading it can never run code.
+        """
+        stat = config_path.stat()
+        key = [stat.st_mtime_ns, stat.st_size]
+        digest = hashlib.sha1(str(config_path.resolve()).encode()).hexdigest()
+        cache_file = CONFIG_CACHE_DIR / f"{digest}.json"
+        
+        try:
+            with open(cache_file, 'r') as f:
+                cached = json.load(f)
+            if cached["key"] == key:
+                return cached["config"]
+        except Exception:
+            pass  # Missing or unreadable cache, parse the file
+        
+        with open(config_path, 'r') as f:
+            config = yaml.load(f, Loader=SafeLoader)
+        
+        try:
+            data = json.dumps({"key": key, "config": config})
+        except (TypeError, ValueError):
+            return config  # e.g. YAML dates, which JSON cannot hold
+        if json.loads(data)["config"] != config:
+            return config  # e.g. non-string keys, which JSON would rename
+        
+        try:
+            CONFIG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Write then rename so concurrent readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=CONFIG_CACHE_DIR, suffix=".tmp")
+            with os.fdopen(fd, 'w') as f:
+                f.write(data)
+            os.replace(tmp_path, cache_file)
+        except OSError as e:
+            logger.debug(f"Could not cache config {config_path}: {e}")
+        
+        return config
+    
     def _create_default_config(self):
         """Create default server configuration."""
         self.server_configs = {
-            "climada": {
-                "module": "src.MCP.servers.climada_server",
-                "description": "CLIMADA climate risk assessment",
-                "port": 8001,
-                "environment": "climada",
-                "enabled": True,
-                "restart_on_failure": True
-            },
-            "lisflood": {
-                "module": "src.MCP.servers.lisflood_server",
-                "description": "LISFLOOD hydrological modeling",
-                "port": 8002,
-                "environment": "lisflood",
-                "enabled": True,
-                "restart_on_failure": True
-            },
-            "cell2fire": {
-                "module": "src.MCP.servers.cell2fire_server",
-                "description": "Cell2Fire wildfire simulation",
-                "port": 8003,
-                "environment": "cell2fire",
-                "enabled": True,
-                "restart_on_failure": True
-            },
-            "pangu": {
-                "module": "src.MCP.servers.pangu_server",
-                "description": "Pangu Weather forecasting",
-                "port": 8004,
-                "environment": "pangu",
-                "enabled": True,
-                "restart_on_failure": True
-            },
-            "aurora": {
-                "module": "src.MCP.servers.aurora_server",
-                "description": "Aurora atmospheric modeling",
-                "port": 8005,
-                "environment": "aurora",
-                "enabled": True,
-                "restart_on_failure": True
-            },
-            "nfdrs4": {
-                "module": "src.MCP.servers.nfdrs4_server",
-                "description": "NFDRS4 fire danger rating",
-                "port": 8006,
-                "environment": "nfdrs4",
-                "enabled": True,
-                "restart_on_failure": True
-            },
-            "filesystem": {
-                "module": "src.MCP.servers.filesystem_server",
-                "description": "Secure filesystem operations",
-                "port": 8007,
-                "environment": "base",
-                "enabled": True,
-                "restart_on_failure": True
-            },
-            "postgresql": {
-                "module": "src.MCP.servers.postgresql_server",
-                "description": "PostgreSQL database access",
-                "port": 8008,
-                "environment": "base",
-                "enabled": False,  # Requires database setup
-                "restart_on_failure": True
-            }
+            name: dict(config) for name, config in _DEFAULT_SERVER_CONFIGS.items()
         }
         
         # Save default config
         self._save_config()
     
-    def _save_config(self):
-        """Save current configuration to file."""
+    def _dump_config(self) -> str:
+        """Serialize the current configuration to YAML."""
         config = {
             "servers": self.server_configs,
-            "global_settings": {
-                "log_level": "INFO",
-                "restart_delay": 5,
-                "max_restarts": 3
-            }
+            "global_settings": self.global_settings
         }
+        return yaml.dump(config, Dumper=SafeDumper, default_flow_style=False, indent=2)
+    
+    @staticmethod
+    def _config_digest(text: str) -> bytes:
+        """Hash serialized config text to detect changes."""
+        return hashlib.blake2b(text.encode()).digest()
+    
+    def _save_config(self):
+        """Save current configuration to file, skipping the write if unchanged."""
+        text = self._dump_config()
+        digest = self._config_digest(text)
+        if digest == self._config_hash and Path(self.config_file).exists():
+            return
         
         try:
-            with open(self.config_file, 'w') as f:
-                yaml.dump(config, f, default_flow_style=False, indent=2)
+            config_path = Path(self.config_file)
+            # Write then rename so a crash never leaves a truncated config
+            fd, tmp_path = tempfile.mkstemp(dir=config_path.parent, suffix=".tmp")
+            try:
+                # mkstemp creates the file owner-only, keep the usual config mode
+                mode = config_path.stat().st_mode & 0o777 if config_path.exists() else 0o644
+                os.fchmod(fd, mode)
+                with os.fdopen(fd, 'w') as f:
+                    f.write(text)
+                os.replace(tmp_path, config_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            self._config_hash = digest
             logger.info(f"Configuration saved to {self.config_file}")
         except Exception as e:
             logger.error(f"Failed to save configuration: {e}")
@@ -152,7 +278,8 @@ class MCPServerManager:
             logger.info(f"Server {server_name} is disabled")
             return False
         
-        if server_name in self.servers and self.servers[server_name].poll() is None:
+        previous = self.servers.get(server_name)
+        if previous is not None and previous.process.returncode is None:
             logger.info(f"Server {server_name} is already running")
             return True
         
@@ -167,60 +294,139 @@ class MCPServerManager:
             
             logger.info(f"Starting {server_name} server: {' '.join(cmd)}")
             
-            process = subprocess.Popen(
-                cmd,
-                env=env,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
+            # Output goes to a log file rather than pipes nobody drains, which
+            # could fill up and block the server
+            log_path = self._server_log_path(server_name)
+            log_path.parent.mkdir(parents=True, exist_ok=True)
             
-            self.servers[server_name] = process
+            ready_read, ready_write = os.pipe()
+            env[READY_FD_ENV] = str(ready_write)
+            try:
+                with open(log_path, "ab") as log_file:
+                    log_start = log_file.tell()
+                    process = await asyncio.create_subprocess_exec(
+                        *cmd,
+                        env=env,
+                        stdout=log_file,
+                        stderr=asyncio.subprocess.STDOUT,
+                        pass_fds=(ready_write,)
+                    )
+            except BaseException:
+                os.close(ready_read)
+                raise
+            finally:
+                # Only the child holds the write end now, so EOF means it exited
+                os.close(ready_write)
             
-            # Wait a moment to check if it started successfully
-            await asyncio.sleep(1)
+            state = ServerState(
+                process=process,
+                started_at=time.monotonic(),
+                restarts=previous.restarts if previous is not None else 0
+            )
+            self.servers[server_name] = state
             
-            if process.poll() is None:
+            ready_timeout = config.get("ready_timeout", READY_TIMEOUT)
+            if await self._wait_until_ready(server_name, process, ready_read, ready_timeout):
                 logger.info(f"Server {server_name} started successfully (PID: {process.pid})")
+                state.watcher = asyncio.create_task(self._watch_child(server_name, state))
                 return True
             else:
-                stdout, stderr = process.communicate()
-                logger.error(f"Server {server_name} failed to start:")
-                logger.error(f"STDOUT: {stdout}")
-                logger.error(f"STDERR: {stderr}")
+                logger.error(f"Server {server_name} failed to start, output:")
+                logger.error(self._read_log_tail(log_path, log_start))
                 return False
         
         except Exception as e:
             logger.error(f"Failed to start server {server_name}: {e}")
             return False
     
+    async def _wait_until_ready(
+        self,
+        server_name: str,
+        process: asyncio.subprocess.Process,
+        ready_fd: int,
+        timeout: float
+    ) -> bool:
+        """
+        Wait for a server to report readiness on its pipe.
+        
+        Returns:
+            True once the server signals it is ready, or if it is still
+            running when the timeout expires; False if it exits first
+        """
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+        transport, _ = await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader),
+            os.fdopen(ready_fd, "rb", buffering=0)
+        )
+        
+        try:
+            async with asyncio.timeout(timeout):
+                line = await reader.readline()
+        except TimeoutError:
+            logger.warning(f"Server {server_name} did not report readiness within {timeout}s")
+            return process.returncode is None
+        finally:
+            transport.close()
+        
+        if line == b"READY\n":
+            return True
+        
+        # The pipe closed without a READY line, so the server is exiting
+        try:
+            async with asyncio.timeout(1):
+                await process.wait()
+        except TimeoutError:
+            pass
+        return process.returncode is None
+    
+    def _server_log_path(self, server_name: str) -> Path:
+        """Return the log file a server's output is written to."""
+        config = self.server_configs.get(server_name, {})
+        return Path(config.get("log_file") or SERVER_LOG_DIR / f"{server_name}.log")
+    
+    def _read_log_tail(self, log_path: Path, start: int) -> str:
+        """Return what was written to a log since ``start``, capped in size."""
+        try:
+            with open(log_path, "rb") as f:
+                size = f.seek(0, os.SEEK_END)
+                f.seek(max(start, size - _FAILED_START_LOG_BYTES))
+                return f.read().decode(errors="replace")
+        except OSError as e:
+            return f"<could not read {log_path}: {e}>"
+    
     async def stop_server(self, server_name: str) -> bool:
         """Stop a specific MCP server."""
         if server_name not in self.servers:
             logger.info(f"Server {server_name} is not running")
             return True
         
-        process = self.servers[server_name]
+        state = self.servers[server_name]
+        process = state.process
+        
+        # A deliberate stop must not trigger an automatic restart
+        watcher = state.watcher
+        if watcher is not None and watcher is not asyncio.current_task():
+            watcher.cancel()
         
         try:
-            if process.poll() is None:
+            if process.returncode is None:
                 logger.info(f"Stopping server {server_name} (PID: {process.pid})")
                 
                 # Try graceful shutdown first
-                process.terminate()
+                process.send_signal(signal.SIGTERM)
                 
-                # Wait for graceful shutdown
+                # Wait for graceful shutdown; the event loop is notified when
+                # the child exits, so there is nothing to poll
                 try:
-                    await asyncio.wait_for(
-                        asyncio.create_task(self._wait_for_process(process)),
-                        timeout=10
-                    )
+                    async with asyncio.timeout(10):
+                        await process.wait()
                     logger.info(f"Server {server_name} stopped gracefully")
-                except asyncio.TimeoutError:
+                except TimeoutError:
                     # Force kill if graceful shutdown fails
                     logger.warning(f"Server {server_name} did not stop gracefully, force killing")
-                    process.kill()
-                    await asyncio.create_task(self._wait_for_process(process))
+                    process.send_signal(signal.SIGKILL)
+                    await process.wait()
             
             del self.servers[server_name]
             return True
@@ -229,33 +435,54 @@ class MCPServerManager:
             logger.error(f"Failed to stop server {server_name}: {e}")
             return False
     
-    async def _wait_for_process(self, process: subprocess.Popen):
-        """Wait for process to terminate."""
-        while process.poll() is None:
-            await asyncio.sleep(0.1)
-    
     async def start_all_servers(self) -> Dict[str, bool]:
-        """Start all enabled servers."""
+        """Start all enabled servers concurrently."""
         results = {}
+        enabled = []
         
         for server_name, config in self.server_configs.items():
             if config.get("enabled", True):
                 logger.info(f"Starting {server_name}...")
-                results[server_name] = await self.start_server(server_name)
+                enabled.append(server_name)
             else:
                 logger.info(f"Skipping disabled server: {server_name}")
                 results[server_name] = False
         
+        # Startup readiness waits overlap instead of adding up per server
+        outcomes = await asyncio.gather(
+            *(self.start_server(server_name) for server_name in enabled),
+            return_exceptions=True
+        )
+        results.update(self._collect_results("start", enabled, outcomes))
+        
         return results
     
     async def stop_all_servers(self) -> Dict[str, bool]:
-        """Stop all running servers."""
-        results = {}
-        
-        for server_name in list(self.servers.keys()):
+        """Stop all running servers concurrently."""
+        running = list(self.servers.keys())
+        for server_name in running:
             logger.info(f"Stopping {server_name}...")
-            results[server_name] = await self.stop_server(server_name)
         
+        outcomes = await asyncio.gather(
+            *(self.stop_server(server_name) for server_name in running),
+            return_exceptions=True
+        )
+        return self._collect_results("stop", running, outcomes)
+    
+    def _collect_results(
+        self,
+        action: str,
+        server_names: List[str],
+        outcomes: List[object]
+    ) -> Dict[str, bool]:
+        """Map gathered start/stop outcomes back to server names."""
+        results = {}
+        for server_name, outcome in zip(server_names, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Failed to {action} server {server_name}: {outcome}")
+                results[server_name] = False
+            else:
+                results[server_name] = outcome
         return results
     
     async def restart_server(self, server_name: str) -> bool:
@@ -284,14 +511,16 @@ class MCPServerManager:
                 "port": config.get("port"),
                 "environment": config.get("environment", "base"),
                 "running": False,
-                "pid": None
+                "pid": None,
+                "restarts": 0
             }
             
-            if server_name in self.servers:
-                process = self.servers[server_name]
-                if process.poll() is None:
+            state = self.servers.get(server_name)
+            if state is not None:
+                server_status["restarts"] = state.restarts
+                if state.process.returncode is None:
                     server_status["running"] = True
-                    server_status["pid"] = process.pid
+                    server_status["pid"] = state.process.pid
                     
             status[server_name] = server_status
         
@@ -306,46 +535,77 @@ class MCPServerManager:
         
         return status
     
-    async def monitor_servers(self):
-        """Monitor servers and restart failed ones."""
-        logger.info("Starting server monitoring")
+    async def _watch_child(self, server_name: str, state: ServerState):
+        """Wait for a server process to exit and restart it if configured to."""
+        returncode = await state.process.wait()
+        
+        if not self.running or self.servers.get(server_name) is not state:
+            return
+        
+        logger.warning(f"Server {server_name} has stopped unexpectedly (exit code {returncode})")
+        
+        config = self.server_configs.get(server_name, {})
+        if not config.get("restart_on_failure", True):
+            logger.info(f"Auto-restart disabled for {server_name}")
+            del self.servers[server_name]  # Remove dead process
+            return
+        
+        restart_delay = config.get("restart_delay", self.global_settings["restart_delay"])
+        max_restarts = config.get("max_restarts", self.global_settings["max_restarts"])
         
-        while self.running:
+        # Only consecutive quick crashes count against the budget
+        if time.monotonic() - state.started_at > RESTART_RESET_AFTER:
+            state.restarts = 0
+        
+        # Keep retrying until a start succeeds (its own watcher takes over
+        # from there) or the budget runs out, so servers that fail during
+        # startup are backed off too
+        while state.restarts < max_restarts:
+            # Back off exponentially so a server that crashes on startup
+            # cannot keep the manager busy respawning it
+            await asyncio.sleep(restart_delay * 2 ** state.restarts)
+            if not self.running or self.servers.get(server_name) is not state:
+                return
+            
+            logger.info(f"Attempting to restart {server_name}")
+            # The dead state stays registered so the new one inherits the count
+            state.restarts += 1
             try:
-                for server_name, config in self.server_configs.items():
-                    if not config.get("enabled", True):
-                        continue
-                    
-                    if server_name not in self.servers:
-                        continue
-                    
-                    process = self.servers[server_name]
-                    
-                    # Check if process is still running
-                    if process.poll() is not None:
-                        logger.warning(f"Server {server_name} has stopped unexpectedly")
-                        
-                        if config.get("restart_on_failure", True):
-                            logger.info(f"Attempting to restart {server_name}")
-                            del self.servers[server_name]  # Remove dead process
-                            await self.start_server(server_name)
-                        else:
-                            logger.info(f"Auto-restart disabled for {server_name}")
-                
-                # Wait before next check
-                await asyncio.sleep(30)
-                
+                if await self.start_server(server_name):
+                    return
             except Exception as e:
-                logger.error(f"Error in server monitoring: {e}")
-                await asyncio.sleep(30)
+                logger.error(f"Error restarting server {server_name}: {e}")
+            
+            # A failed start may have registered a new dead state; adopt it so
+            # stop_server can still cancel this retry loop
+            state = self.servers.get(server_name, state)
+            state.watcher = asyncio.current_task()
+        
+        logger.error(
+            f"Server {server_name} exited {state.restarts + 1} times in a row, "
+            f"giving up on restarts"
+        )
+    
+    async def monitor_servers(self):
+        """
+        Monitor servers until shutdown.
+        
+        Each started server has its own task waiting on the process, which
+        restarts it as soon as it exits; this only waits for the stop signal.
+        """
+        logger.info("Starting server monitoring")
+        await self._stopped_event.wait()
     
     async def run(self):
         """Run the server manager."""
         self.running = True
+        self._stopped_event.clear()
         
-        # Setup signal handlers
-        for sig in [signal.SIGTERM, signal.SIGINT]:
-            signal.signal(sig, self._signal_handler)
+        # Setup signal handlers on the loop so they can wake monitor_servers
+        loop = asyncio.get_running_loop()
+        shutdown_signals = [signal.SIGTERM, signal.SIGINT]
+        for sig in shutdown_signals:
+            loop.add_signal_handler(sig, self._signal_handler, sig, None)
         
         try:
             # Start all enabled servers
@@ -362,16 +622,20 @@ class MCPServerManager:
             logger.info("Received interrupt signal")
         finally:
             await self.shutdown()
+            for sig in shutdown_signals:
+                loop.remove_signal_handler(sig)
     
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals."""
         logger.info(f"Received signal {signum}, shutting down...")
         self.running = False
+        self._stopped_event.set()
     
     async def shutdown(self):
         """Shutdown all servers."""
         logger.info("Shutting down MCP Server Manager")
         self.running = False
+        self._stopped_event.set()
         
         stop_results = await self.stop_all_servers()
         successful_stops = sum(1 for success in stop_results.values() if success)
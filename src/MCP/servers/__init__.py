@@ -6,6 +6,7 @@ from .cell2fire_server import Cell2FireServer
 from .pangu_server import PanguServer
 from .aurora_server import AuroraServer
 from .nfdrs4_server import NFDRS4Server
+from .combined_server import CombinedServer
 
 __all__ = [
     'CliMadaServer',
@@ -13,5 +14,6 @@ __all__ = [
     'Cell2FireServer',
     'PanguServer',
     'AuroraServer',
-    'NFDRS4Server'
+    'NFDRS4Server',
+    'CombinedServer'
 ]
\ No newline at end of file
@@ -6,9 +6,9 @@ This server provides Model Context Protocol (MCP) interface for Aurora
 atmospheric foundation model.
 """
 
-import asyncio
 import logging
 import os
+from types import MappingProxyType
 from typing import Any, Dict, List
 
 from mcp.server import Server
@@ -16,11 +16,31 @@ from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
 from mcp.types import Resource, Tool, TextContent
 
-from ..core.base_model import BaseMCPModel
+from ..core.base_model import BaseMCPModel, notify_ready, run_server
+from .common import call_runner
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Input schema of the aurora_forecast tool
+_AURORA_FORECAST_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "region": {
+            "type": "object",
+            "properties": {
+                "north": {"type": "number"},
+                "south": {"type": "number"},
+                "east": {"type": "number"},
+                "west": {"type": "number"}
+            }
+        },
+        "forecast_steps": {"type": "integer", "default": 40},
+        "resolution": {"type": "string", "default": "0.1deg"}
+    },
+    "required": ["region"]
+})
+
 
 class AuroraServer(BaseMCPModel):
     """Aurora MCP Server for atmospheric modeling."""
@@ -36,58 +56,40 @@ class AuroraServer(BaseMCPModel):
     def _setup_tools(self):
         """Setup Aurora-specific tools."""
         
+        # Tool definitions are static, build them once instead of per request
+        self._tools = [
+            Tool(
+                name="aurora_forecast",
+                description="Generate atmospheric forecast using Aurora model",
+                inputSchema=dict(_AURORA_FORECAST_SCHEMA)
+            )
+        ]
+        # Tool name -> coroutine running it, also used by the combined server
+        self._runners = {"aurora_forecast": self._run_forecast}
+        
         @self.server.list_tools()
         async def handle_list_tools() -> List[Tool]:
-            return [
-                Tool(
-                    name="aurora_forecast",
-                    description="Generate atmospheric forecast using Aurora model",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "region": {
-                                "type": "object",
-                                "properties": {
-                                    "north": {"type": "number"},
-                                    "south": {"type": "number"},
-                                    "east": {"type": "number"},
-                                    "west": {"type": "number"}
-                                }
-                            },
-                            "forecast_steps": {"type": "integer", "default": 40},
-                            "resolution": {"type": "string", "default": "0.1deg"}
-                        },
-                        "required": ["region"]
-                    }
-                )
-            ]
+            return self._tools
         
         @self.server.call_tool()
         async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
-            try:
-                if name == "aurora_forecast":
-                    result = await self._run_forecast(arguments)
-                else:
-                    raise ValueError(f"Unknown tool: {name}")
-                
-                return [TextContent(type="text", text=str(result))]
-            except Exception as e:
-                logger.error(f"Tool execution failed: {e}")
-                return [TextContent(type="text", text=f"Error: {str(e)}")]
+            return await call_runner(self._runners, name, arguments)
     
     def _setup_resources(self):
         """Setup Aurora resources."""
         
+        self._resources = [
+            Resource(
+                uri="aurora://model_checkpoints",
+                name="Aurora Model Checkpoints",
+                description="Pre-trained Aurora model checkpoints",
+                mimeType="application/json"
+            )
+        ]
+        
         @self.server.list_resources()
         async def handle_list_resources() -> List[Resource]:
-            return [
-                Resource(
-                    uri="aurora://model_checkpoints",
-                    name="Aurora Model Checkpoints",
-                    description="Pre-trained Aurora model checkpoints",
-                    mimeType="application/json"
-                )
-            ]
+            return self._resources
     
     async def _run_forecast(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Run Aurora atmospheric forecast."""
@@ -115,6 +117,7 @@ async def main():
     server_instance = AuroraServer()
     
     async with stdio_server() as (read_stream, write_stream):
+        notify_ready()
         await server_instance.server.run(
             read_stream,
             write_stream,
@@ -130,4 +133,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run_server(main())
\ No newline at end of file
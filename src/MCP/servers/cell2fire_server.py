@@ -6,10 +6,10 @@ This server provides Model Context Protocol (MCP) interface for Cell2Fire
 cellular automata wildfire spread modeling.
 """
 
-import asyncio
 import logging
 import os
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Dict, List
 
 from mcp.server import Server
@@ -17,12 +17,43 @@ from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
 from mcp.types import Resource, Tool, TextContent
 
-from ..core.base_model import BaseMCPModel
+from ..core.base_model import BaseMCPModel, notify_ready, run_server
 from ..core.environment_manager import environment_manager
+from .common import call_runner
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Input schema of the cell2fire_simulate tool
+_CELL2FIRE_SIMULATE_SCHEMA = MappingProxyType({
+    "type": "object",
+    "properties": {
+        "ignition_points": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "x": {"type": "number"},
+                    "y": {"type": "number"},
+                    "ignition_time": {"type": "integer", "default": 0}
+                }
+            }
+        },
+        "weather_scenario": {
+            "type": "object",
+            "properties": {
+                "wind_speed": {"type": "number"},
+                "wind_direction": {"type": "number"},
+                "temperature": {"type": "number"},
+                "humidity": {"type": "number"}
+            }
+        },
+        "fuel_model": {"type": "string", "default": "standard"},
+        "simulation_time": {"type": "integer", "default": 1440}  # minutes
+    },
+    "required": ["ignition_points", "weather_scenario"]
+})
+
 
 class Cell2FireServer(BaseMCPModel):
     """Cell2Fire MCP Server for wildfire modeling."""
@@ -38,69 +69,40 @@ class Cell2FireServer(BaseMCPModel):
     def _setup_tools(self):
         """Setup Cell2Fire-specific tools."""
         
+        # Tool definitions are static, build them once instead of per request
+        self._tools = [
+            Tool(
+                name="cell2fire_simulate",
+                description="Simulate wildfire spread using Cell2Fire",
+                inputSchema=dict(_CELL2FIRE_SIMULATE_SCHEMA)
+            )
+        ]
+        # Tool name -> coroutine running it, also used by the combined server
+        self._runners = {"cell2fire_simulate": self._run_simulation}
+        
         @self.server.list_tools()
         async def handle_list_tools() -> List[Tool]:
-            return [
-                Tool(
-                    name="cell2fire_simulate",
-                    description="Simulate wildfire spread using Cell2Fire",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "ignition_points": {
-                                "type": "array",
-                                "items": {
-                                    "type": "object",
-                                    "properties": {
-                                        "x": {"type": "number"},
-                                        "y": {"type": "number"},
-                                        "ignition_time": {"type": "integer", "default": 0}
-                                    }
-                                }
-                            },
-                            "weather_scenario": {
-                                "type": "object",
-                                "properties": {
-                                    "wind_speed": {"type": "number"},
-                                    "wind_direction": {"type": "number"},
-                                    "temperature": {"type": "number"},
-                                    "humidity": {"type": "number"}
-                                }
-                            },
-                            "fuel_model": {"type": "string", "default": "standard"},
-                            "simulation_time": {"type": "integer", "default": 1440}  # minutes
-                        },
-                        "required": ["ignition_points", "weather_scenario"]
-                    }
-                )
-            ]
+            return self._tools
         
         @self.server.call_tool()
         async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
-            try:
-                if name == "cell2fire_simulate":
-                    result = await self._run_simulation(arguments)
-                else:
-                    raise ValueError(f"Unknown tool: {name}")
-                
-                return [TextContent(type="text", text=str(result))]
-            except Exception as e:
-                logger.error(f"Tool execution failed: {e}")
-                return [TextContent(type="text", text=f"Error: {str(e)}")]
+            return await call_runner(self._runners, name, arguments)
     
     def _setup_resources(self):
         """Setup Cell2Fire resources."""
         
+        self._resources = [
+            Resource(
+                uri="cell2fire://fuel_models",
+                name="Fuel Models",
+                description="Available fuel models for wildfire simulation",
+                mimeType="application/json"
+            )
+        ]
+        
         @self.server.list_resources()
         async def handle_list_resources() -> List[Resource]:
-            return [
-                Resource(
-                    uri="cell2fire://fuel_models",
-                    name="Fuel Models",
-                    description="Available fuel models for wildfire simulation",
-                    mimeType="application/json"
-                )
-            ]
+            return self._resources
     
     async def _run_simulation(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Run Cell2Fire wildfire simulation."""
@@ -123,6 +125,7 @@ async def main():
     server_instance = Cell2FireServer()
     
     async with stdio_server() as (read_stream, write_stream):
+        notify_ready()
         await server_instance.server.run(
             read_stream,
             write_stream,
@@ -138,4 +141,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run_server(main())
\ No newline at end of file
@@ -7,23 +7,185 @@ climate risk assessment tools.
 """
 
 import asyncio
+import json
 import logging
 import os
-from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - optional speedup
+    from json import loads as json_loads
+
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
 from mcp.types import Resource, Tool, TextContent
 
-from ..core.base_model import BaseMCPModel
-from ..core.environment_manager import environment_manager
+from ..core.base_model import BaseMCPModel, notify_ready, run_server
+from ..core.environment_manager import OUTPUT_TAIL_BYTES, environment_manager
+from .common import call_runner
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Number of persistent CLIMADA worker processes serving impact assessments
+CLIMADA_WORKERS = max(1, int(os.getenv("CLIMADA_WORKERS", "1")))
+
+# Worker loop run inside the CLIMADA environment. CLIMADA is imported once,
+# then one JSON request per stdin line is answered with one JSON line.
+_WORKER_SCRIPT = """
+import json
+import os
+import sys
+
+# Keep the protocol stream private; anything printed by CLIMADA goes to stderr
+_out = os.fdopen(os.dup(1), "w")
+os.dup2(2, 1)
+sys.stdout = sys.stderr
+
+sys.path.append(sys.argv[1])
+
+from climada.entity import Exposures, ImpactFuncSet
+from climada.hazard import Hazard
+from climada.engine import Impact
+
+
+def impact(params):
+    hazard_type = params["hazard_type"]
+    intensity = params["intensity"]
+    
+    # Create mock hazard for demonstration
+    hazard = Hazard(haz_type=hazard_type.upper())
+    # In real implementation, load actual hazard data based on location
+    
+    # Create exposure
+    exposures = Exposures()
+    # In real implementation, load exposure data for location
+    
+    # Create impact functions
+    impact_funcs = ImpactFuncSet()
+    # In real implementation, load vulnerability functions
+    
+    # Calculate impact
+    impact = Impact()
+    # impact.calc(exposures, impact_funcs, hazard)
+    
+    # Mock result for demonstration
+    return {
+        "economic_damage": intensity * 1000000,  # USD
+        "affected_people": int(intensity * 10000),
+        "location": params["location"],
+        "hazard_type": hazard_type,
+        "confidence": 0.8
+    }
+
+
+OPS = {"impact": impact}
+
+for line in sys.stdin:
+    request = json.loads(line)
+    try:
+        response = {"result": OPS[request["op"]](request["params"])}
+    except Exception as e:
+        response = {"error": f"{type(e).__name__}: {e}"}
+    _out.write(json.dumps(response) + "\\n")
+    _out.flush()
+"""
+
+
+class _ClimadaWorker:
+    """A long-lived Python process in the CLIMADA environment."""
+    
+    def __init__(self, environment_name: str, climada_path: str):
+        self.environment_name = environment_name
+        self.climada_path = climada_path
+        self.process: Optional[asyncio.subprocess.Process] = None
+        # One request/response exchange on the pipes at a time
+        self.lock = asyncio.Lock()
+    
+    async def _start(self) -> asyncio.subprocess.Process:
+        argv, process_env = environment_manager.resolve_command(
+            self.environment_name,
+            ["python", "-u", "-c", _WORKER_SCRIPT, self.climada_path]
+        )
+        logger.info(f"Starting CLIMADA worker in environment '{self.environment_name}'")
+        return await asyncio.create_subprocess_exec(
+            *argv,
+            cwd=self.climada_path,
+            env=process_env,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            limit=OUTPUT_TAIL_BYTES
+        )
+    
+    async def request(self, op: str, params: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """
+        Send one request to the worker and wait for its response.
+        
+        The worker is restarted if it has exited. Any exchange that does not
+        end with a complete reply (timeout, cancellation, oversized line)
+        kills the worker, since its pending reply would otherwise be read as
+        the answer to the next request.
+        """
+        payload = json.dumps({"op": op, "params": params}).encode() + b"\n"
+        async with self.lock:
+            process = await self._ensure_started()
+            
+            try:
+                async with asyncio.timeout(timeout):
+                    process.stdin.write(payload)
+                    await process.stdin.drain()
+                    line = await process.stdout.readline()
+            except TimeoutError:
+                await self._kill()
+                raise TimeoutError(f"CLIMADA worker timed out after {timeout} seconds")
+            except (BrokenPipeError, ConnectionResetError):
+                line = b""
+            except BaseException:
+                await self._kill()
+                raise
+            
+            if not line:
+                await self._kill()
+                raise RuntimeError("CLIMADA worker exited unexpectedly")
+        
+        response = json_loads(line)
+        if "error" in response:
+            raise RuntimeError(f"CLIMADA execution failed: {response['error']}")
+        return response["result"]
+    
+    async def _ensure_started(self) -> asyncio.subprocess.Process:
+        if self.process is None or self.process.returncode is not None:
+            self.process = await self._start()
+        return self.process
+    
+    async def start(self):
+        """Start the worker ahead of the first request."""
+        async with self.lock:
+            await self._ensure_started()
+    
+    async def _kill(self):
+        process, self.process = self.process, None
+        if process is not None and process.returncode is None:
+            process.kill()
+            await process.wait()
+    
+    async def close(self):
+        """Stop the worker by closing its stdin."""
+        async with self.lock:
+            process, self.process = self.process, None
+            if process is None or process.returncode is not None:
+                return
+            process.stdin.close()
+            try:
+                async with asyncio.timeout(5):
+                    await process.wait()
+            except TimeoutError:
+                process.kill()
+                await process.wait()
+
 
 class CliMadaServer(BaseMCPModel):
     """CLIMADA MCP Server for climate risk assessment."""
@@ -33,123 +195,126 @@ class CliMadaServer(BaseMCPModel):
         self.climada_path = os.getenv("CLIMADA_HOST", "/data/Tiaozhanbei/Climada")
         self.environment_name = os.getenv("CLIMADA_ENV", "climada")
         self.server = Server("climada-server")
+        self._workers = [
+            _ClimadaWorker(self.environment_name, self.climada_path)
+            for _ in range(CLIMADA_WORKERS)
+        ]
+        self._next_worker = 0
         self._setup_tools()
         self._setup_resources()
     
     def _setup_tools(self):
         """Setup CLIMADA-specific tools."""
         
-        @self.server.list_tools()
-        async def handle_list_tools() -> List[Tool]:
-            """List available CLIMADA tools."""
-            return [
-                Tool(
-                    name="climada_impact_assessment",
-                    description="Assess economic impact of disasters using CLIMADA",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "hazard_type": {
-                                "type": "string",
-                                "enum": ["wildfire", "flood", "earthquake", "hurricane"],
-                                "description": "Type of disaster to assess"
-                            },
-                            "location": {
-                                "type": "object",
-                                "properties": {
-                                    "lat": {"type": "number", "description": "Latitude"},
-                                    "lng": {"type": "number", "description": "Longitude"},
-                                    "country": {"type": "string", "description": "Country code"}
-                                },
-                                "required": ["lat", "lng"]
-                            },
-                            "intensity": {
-                                "type": "number",
-                                "minimum": 0,
-                                "maximum": 1,
-                                "description": "Disaster intensity (0-1)"
-                            },
-                            "exposure_data": {
-                                "type": "object",
-                                "description": "Exposure data for impact calculation"
-                            }
+        # Tool definitions are static, build them once instead of per request
+        self._tools = [
+            Tool(
+                name="climada_impact_assessment",
+                description="Assess economic impact of disasters using CLIMADA",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "hazard_type": {
+                            "type": "string",
+                            "enum": ["wildfire", "flood", "earthquake", "hurricane"],
+                            "description": "Type of disaster to assess"
                         },
-                        "required": ["hazard_type", "location", "intensity"]
-                    }
-                ),
-                Tool(
-                    name="climada_hazard_modeling",
-                    description="Model hazard scenarios using CLIMADA",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "hazard_type": {"type": "string"},
-                            "scenario_params": {"type": "object"},
-                            "time_horizon": {"type": "integer", "default": 50}
+                        "location": {
+                            "type": "object",
+                            "properties": {
+                                "lat": {"type": "number", "description": "Latitude"},
+                                "lng": {"type": "number", "description": "Longitude"},
+                                "country": {"type": "string", "description": "Country code"}
+                            },
+                            "required": ["lat", "lng"]
                         },
-                        "required": ["hazard_type"]
-                    }
-                ),
-                Tool(
-                    name="climada_cost_benefit",
-                    description="Perform cost-benefit analysis for adaptation measures",
-                    inputSchema={
-                        "type": "object", 
-                        "properties": {
-                            "measures": {"type": "array", "items": {"type": "string"}},
-                            "time_horizon": {"type": "integer", "default": 30},
-                            "discount_rate": {"type": "number", "default": 0.03}
+                        "intensity": {
+                            "type": "number",
+                            "minimum": 0,
+                            "maximum": 1,
+                            "description": "Disaster intensity (0-1)"
                         },
-                        "required": ["measures"]
-                    }
-                )
-            ]
+                        "exposure_data": {
+                            "type": "object",
+                            "description": "Exposure data for impact calculation"
+                        }
+                    },
+                    "required": ["hazard_type", "location", "intensity"]
+                }
+            ),
+            Tool(
+                name="climada_hazard_modeling",
+                description="Model hazard scenarios using CLIMADA",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "hazard_type": {"type": "string"},
+                        "scenario_params": {"type": "object"},
+                        "time_horizon": {"type": "integer", "default": 50}
+                    },
+                    "required": ["hazard_type"]
+                }
+            ),
+            Tool(
+                name="climada_cost_benefit",
+                description="Perform cost-benefit analysis for adaptation measures",
+                inputSchema={
+                    "type": "object", 
+                    "properties": {
+                        "measures": {"type": "array", "items": {"type": "string"}},
+                        "time_horizon": {"type": "integer", "default": 30},
+                        "discount_rate": {"type": "number", "default": 0.03}
+                    },
+                    "required": ["measures"]
+                }
+            )
+        ]
+        
+        @self.server.list_tools()
+        async def handle_list_tools() -> List[Tool]:
+            """List available CLIMADA tools."""
+            return self._tools
+        
+        # Tool name -> coroutine running it
+        self._runners = {
+            "climada_impact_assessment": self._run_impact_assessment,
+            "climada_hazard_modeling": self._run_hazard_modeling,
+            "climada_cost_benefit": self._run_cost_benefit
+        }
         
         @self.server.call_tool()
         async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             """Handle tool execution."""
-            try:
-                if name == "climada_impact_assessment":
-                    result = await self._run_impact_assessment(arguments)
-                elif name == "climada_hazard_modeling":
-                    result = await self._run_hazard_modeling(arguments)
-                elif name == "climada_cost_benefit":
-                    result = await self._run_cost_benefit(arguments)
-                else:
-                    raise ValueError(f"Unknown tool: {name}")
-                
-                return [TextContent(type="text", text=str(result))]
-                
-            except Exception as e:
-                logger.error(f"Tool execution failed: {e}")
-                return [TextContent(type="text", text=f"Error: {str(e)}")]
+            return await call_runner(self._runners, name, arguments)
     
     def _setup_resources(self):
         """Setup CLIMADA resources."""
         
+        self._resources = [
+            Resource(
+                uri="climada://hazard_sets",
+                name="CLIMADA Hazard Sets",
+                description="Available hazard datasets in CLIMADA",
+                mimeType="application/json"
+            ),
+            Resource(
+                uri="climada://exposure_data", 
+                name="Exposure Data",
+                description="Economic exposure data for impact assessment",
+                mimeType="application/json"
+            ),
+            Resource(
+                uri="climada://vulnerability_functions",
+                name="Vulnerability Functions",
+                description="Damage functions for different hazards",
+                mimeType="application/json"
+            )
+        ]
+        
         @self.server.list_resources()
         async def handle_list_resources() -> List[Resource]:
             """List available CLIMADA resources."""
-            return [
-                Resource(
-                    uri="climada://hazard_sets",
-                    name="CLIMADA Hazard Sets",
-                    description="Available hazard datasets in CLIMADA",
-                    mimeType="application/json"
-                ),
-                Resource(
-                    uri="climada://exposure_data", 
-                    name="Exposure Data",
-                    description="Economic exposure data for impact assessment",
-                    mimeType="application/json"
-                ),
-                Resource(
-                    uri="climada://vulnerability_functions",
-                    name="Vulnerability Functions",
-                    description="Damage functions for different hazards",
-                    mimeType="application/json"
-                )
-            ]
+            return self._resources
     
     async def _run_impact_assessment(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Run CLIMADA impact assessment."""
@@ -164,64 +329,10 @@ class CliMadaServer(BaseMCPModel):
         if not env_validation["environment_accessible"]:
             raise RuntimeError(f"CLIMADA environment '{self.environment_name}' not accessible")
         
-        # Prepare CLIMADA script
-        script_content = f"""
-import sys
-sys.path.append('{self.climada_path}')
-
-from climada.entity import Exposures, ImpactFuncSet
-from climada.hazard import Hazard
-from climada.engine import Impact
-import json
-
-# Parameters
-hazard_type = '{params['hazard_type']}'
-location = {params['location']}
-intensity = {params['intensity']}
-
-# Create mock hazard for demonstration
-hazard = Hazard(haz_type=hazard_type.upper())
-# In real implementation, load actual hazard data based on location
-
-# Create exposure
-exposures = Exposures()
-# In real implementation, load exposure data for location
-
-# Create impact functions
-impact_funcs = ImpactFuncSet()
-# In real implementation, load vulnerability functions
-
-# Calculate impact
-impact = Impact()
-# impact.calc(exposures, impact_funcs, hazard)
-
-# Mock result for demonstration
-result = {{
-    'economic_damage': {params['intensity']} * 1000000,  # USD
-    'affected_people': int({params['intensity']} * 10000),
-    'location': location,
-    'hazard_type': hazard_type,
-    'confidence': 0.8
-}}
-
-print(json.dumps(result))
-"""
-        
         try:
-            # Execute CLIMADA script in environment
-            result = await environment_manager._run_in_environment(
-                self.environment_name,
-                ["python", "-c", script_content],
-                timeout=300,
-                cwd=Path(self.climada_path)
-            )
-            
-            if result.returncode == 0:
-                import json
-                return json.loads(result.stdout.decode().strip())
-            else:
-                raise RuntimeError(f"CLIMADA execution failed: {result.stderr.decode()}")
-                
+            # Imports are paid once per worker, not once per call
+            return await self._pick_worker().request("impact", params, timeout=300)
+        
         except Exception as e:
             logger.error(f"Impact assessment failed: {e}")
             # Return mock data as fallback
@@ -234,6 +345,29 @@ print(json.dumps(result))
                 "status": "mock_data"
             }
     
+    def _pick_worker(self) -> _ClimadaWorker:
+        """Return an idle worker, or the next one in turn if all are busy."""
+        for worker in self._workers:
+            if not worker.lock.locked():
+                return worker
+        worker = self._workers[self._next_worker]
+        self._next_worker = (self._next_worker + 1) % len(self._workers)
+        return worker
+    
+    async def start_workers(self):
+        """Start the CLIMADA workers so they import CLIMADA before the first call."""
+        outcomes = await asyncio.gather(
+            *(worker.start() for worker in self._workers),
+            return_exceptions=True
+        )
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                logger.warning(f"Could not start CLIMADA worker: {outcome}")
+    
+    async def close(self):
+        """Stop the CLIMADA worker processes."""
+        await asyncio.gather(*(worker.close() for worker in self._workers))
+    
     async def _run_hazard_modeling(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Run CLIMADA hazard modeling."""
         logger.info(f"Running hazard modeling with params: {params}")
@@ -268,22 +402,28 @@ print(json.dumps(result))
 
 async def main():
     """Run the CLIMADA MCP server."""
+    await environment_manager.start()
     server_instance = CliMadaServer()
     
-    async with stdio_server() as (read_stream, write_stream):
-        await server_instance.server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="climada-server",
-                server_version="1.0.0",
-                capabilities=server_instance.server.get_capabilities(
-                    notification_options=None,
-                    experimental_capabilities=None
+    try:
+        await server_instance.start_workers()
+        async with stdio_server() as (read_stream, write_stream):
+            notify_ready()
+            await server_instance.server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="climada-server",
+                    server_version="1.0.0",
+                    capabilities=server_instance.server.get_capabilities(
+                        notification_options=None,
+                        experimental_capabilities=None
+                    )
                 )
             )
-        )
+    finally:
+        await server_instance.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run_server(main())
\ No newline at end of file
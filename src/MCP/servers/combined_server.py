@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Combined MCP Server for co-located models.
+
+This server exposes the tools and resources of several model servers
+through a single MCP server, so a host running them all needs one Python
+process instead of one per model.
+"""
+
+import logging
+from typing import Any, Dict, List
+
+from mcp.server import Server
+from mcp.server.models import InitializationOptions
+from mcp.server.stdio import stdio_server
+from mcp.types import Resource, Tool, TextContent
+
+from ..core.base_model import notify_ready, run_server
+from .aurora_server import AuroraServer
+from .cell2fire_server import Cell2FireServer
+from .common import ToolRunners, call_runner
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Model servers merged into the combined server by default
+DEFAULT_BACKENDS = (AuroraServer, Cell2FireServer)
+
+
+class CombinedServer:
+    """MCP Server multiplexing several model servers in one process."""
+    
+    def __init__(self, backends=DEFAULT_BACKENDS):
+        self.backends = [backend_class() for backend_class in backends]
+        self.server = Server("combined-server")
+        self._tools: List[Tool] = []
+        self._resources: List[Resource] = []
+        self._runners: ToolRunners = {}
+        
+        for backend in self.backends:
+            for tool in backend._tools:
+                if tool.name in self._runners:
+                    raise ValueError(f"Duplicate tool name across backends: {tool.name}")
+                self._tools.append(tool)
+                self._runners[tool.name] = backend._runners[tool.name]
+            self._resources.extend(backend._resources)
+        
+        self._setup_handlers()
+    
+    def _setup_handlers(self):
+        """Register handlers that route requests to the owning backend."""
+        
+        @self.server.list_tools()
+        async def handle_list_tools() -> List[Tool]:
+            return self._tools
+        
+        @self.server.call_tool()
+        async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
+            return await call_runner(self._runners, name, arguments)
+        
+        @self.server.list_resources()
+        async def handle_list_resources() -> List[Resource]:
+            return self._resources
+
+
+async def main():
+    """Run the combined MCP server."""
+    server_instance = CombinedServer()
+    
+    async with stdio_server() as (read_stream, write_stream):
+        notify_ready()
+        await server_instance.server.run(
+            read_stream,
+            write_stream,
+            InitializationOptions(
+                server_name="combined-server",
+                server_version="1.0.0",
+                capabilities=server_instance.server.get_capabilities(
+                    notification_options=None,
+                    experimental_capabilities=None
+                )
+            )
+        )
+
+
+if __name__ == "__main__":
+    run_server(main())
\ No newline at end of file
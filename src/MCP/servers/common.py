@@ -0,0 +1,27 @@
+"""Helpers shared by the MCP model servers."""
+
+import logging
+from typing import Any, Awaitable, Callable, Dict, List
+
+from mcp.types import TextContent
+
+from ..core.base_model import result_to_json
+
+logger = logging.getLogger(__name__)
+
+# Tool name -> coroutine running the tool with its arguments
+ToolRunners = Dict[str, Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]]
+
+
+async def call_runner(runners: ToolRunners, name: str, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Run a tool from ``runners`` and return its result as MCP text content."""
+    try:
+        runner = runners.get(name)
+        if runner is None:
+            raise ValueError(f"Unknown tool: {name}")
+        result = await runner(arguments)
+        
+        return [TextContent(type="text", text=result_to_json(result))]
+    except Exception as e:
+        logger.error(f"Tool execution failed: {e}")
+        return [TextContent(type="text", text=f"Error: {str(e)}")]
\ No newline at end of file
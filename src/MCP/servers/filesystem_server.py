@@ -7,22 +7,37 @@ for the emergency management system.
 """
 
 import asyncio
+import codecs
+import io
 import logging
+import mmap
 import os
 import stat
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set
 
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
 from mcp.types import Resource, Tool, TextContent
 
-from ..core.base_model import BaseMCPModel
+from ..core.base_model import BaseMCPModel, notify_ready, result_to_json, run_server
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Filesystem operations allowed to run in worker threads at once
+MAX_CONCURRENT_IO = 32
+
+# Seconds a computed resource list is reused before re-checking the directories
+RESOURCE_LIST_TTL = 5.0
+
+
+def _dir_prefix(path: str) -> str:
+    """Return a path with a trailing separator for prefix comparisons."""
+    return path if path.endswith(os.sep) else path + os.sep
+
 
 class FilesystemServer(BaseMCPModel):
     """Secure Filesystem MCP Server with access control."""
@@ -44,6 +59,20 @@ class FilesystemServer(BaseMCPModel):
         self.readonly_paths: Set[Path] = {
             Path("/data/Tiaozhanbei").resolve()  # Model data is read-only
         }
+        # Separator-terminated prefixes so access checks are plain str.startswith
+        self._allowed_prefixes = tuple(_dir_prefix(str(p)) for p in self.allowed_paths)
+        self._readonly_prefixes = tuple(_dir_prefix(str(p)) for p in self.readonly_paths)
+        
+        # Tool name -> blocking implementation, run off the event loop
+        self._runners: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            "read_file": self._read_file,
+            "write_file": self._write_file,
+            "list_directory": self._list_directory,
+            "create_directory": self._create_directory,
+            "delete_file": self._delete_file,
+            "file_info": self._file_info
+        }
+        self._io_slots = asyncio.Semaphore(MAX_CONCURRENT_IO)
         
         # Ensure temp directory exists
         temp_path = Path("/tmp/emergency_management")
@@ -56,162 +85,162 @@ class FilesystemServer(BaseMCPModel):
         """Check if path access is allowed."""
         try:
             resolved_path = path.resolve()
-            
-            # Check if path is within allowed directories
-            for allowed_path in self.allowed_paths:
-                try:
-                    resolved_path.relative_to(allowed_path)
-                    # Path is allowed, check write permissions
-                    if write_access:
-                        for readonly_path in self.readonly_paths:
-                            try:
-                                resolved_path.relative_to(readonly_path)
-                                return False  # Write not allowed in readonly path
-                            except ValueError:
-                                continue
-                    return True
-                except ValueError:
-                    continue
-            
-            return False
         except (OSError, ValueError):
             return False
+        return self._is_resolved_allowed(str(resolved_path), write_access)
+    
+    def _is_resolved_allowed(self, resolved: str, write_access: bool = False) -> bool:
+        """Check access for an already resolved path string."""
+        # Decisions are not cached: a symlink can be retargeted between calls
+        prefixed = _dir_prefix(resolved)
+        if not prefixed.startswith(self._allowed_prefixes):
+            return False
+        
+        # Write not allowed in readonly paths
+        return not (write_access and prefixed.startswith(self._readonly_prefixes))
+    
+    async def _run_blocking(
+        self,
+        func: Callable[[Dict[str, Any]], Dict[str, Any]],
+        params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Run a blocking filesystem operation in a worker thread."""
+        async with self._io_slots:
+            return await asyncio.to_thread(func, params)
     
     def _setup_tools(self):
         """Setup filesystem tools."""
         
-        @self.server.list_tools()
-        async def handle_list_tools() -> List[Tool]:
-            return [
-                Tool(
-                    name="read_file",
-                    description="Read contents of a file (with access control)",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "path": {
-                                "type": "string",
-                                "description": "Path to the file to read"
-                            },
-                            "encoding": {
-                                "type": "string",
-                                "default": "utf-8",
-                                "description": "File encoding"
-                            }
+        # Tool definitions are static, build them once instead of per request
+        self._tools = [
+            Tool(
+                name="read_file",
+                description="Read contents of a file (with access control)",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "path": {
+                            "type": "string",
+                            "description": "Path to the file to read"
                         },
-                        "required": ["path"]
-                    }
-                ),
-                Tool(
-                    name="write_file",
-                    description="Write content to a file (with access control)",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "path": {
-                                "type": "string",
-                                "description": "Path to the file to write"
-                            },
-                            "content": {
-                                "type": "string",
-                                "description": "Content to write to the file"
-                            },
-                            "encoding": {
-                                "type": "string",
-                                "default": "utf-8",
-                                "description": "File encoding"
-                            }
+                        "encoding": {
+                            "type": "string",
+                            "default": "utf-8",
+                            "description": "File encoding"
                         },
-                        "required": ["path", "content"]
-                    }
-                ),
-                Tool(
-                    name="list_directory",
-                    description="List contents of a directory",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "path": {
-                                "type": "string",
-                                "description": "Path to the directory to list"
-                            },
-                            "recursive": {
-                                "type": "boolean",
-                                "default": False,
-                                "description": "Whether to list recursively"
-                            }
+                        "max_bytes": {
+                            "type": "integer",
+                            "minimum": 0,
+                            "description": "Read at most this many bytes of the file"
+                        }
+                    },
+                    "required": ["path"]
+                }
+            ),
+            Tool(
+                name="write_file",
+                description="Write content to a file (with access control)",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "path": {
+                            "type": "string",
+                            "description": "Path to the file to write"
                         },
-                        "required": ["path"]
-                    }
-                ),
-                Tool(
-                    name="create_directory",
-                    description="Create a directory",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "path": {
-                                "type": "string",
-                                "description": "Path to the directory to create"
-                            },
-                            "parents": {
-                                "type": "boolean",
-                                "default": True,
-                                "description": "Whether to create parent directories"
-                            }
+                        "content": {
+                            "type": "string",
+                            "description": "Content to write to the file"
                         },
-                        "required": ["path"]
-                    }
-                ),
-                Tool(
-                    name="delete_file",
-                    description="Delete a file (with access control)",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "path": {
-                                "type": "string",
-                                "description": "Path to the file to delete"
-                            }
+                        "encoding": {
+                            "type": "string",
+                            "default": "utf-8",
+                            "description": "File encoding"
+                        }
+                    },
+                    "required": ["path", "content"]
+                }
+            ),
+            Tool(
+                name="list_directory",
+                description="List contents of a directory",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "path": {
+                            "type": "string",
+                            "description": "Path to the directory to list"
                         },
-                        "required": ["path"]
-                    }
-                ),
-                Tool(
-                    name="file_info",
-                    description="Get information about a file or directory",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "path": {
-                                "type": "string",
-                                "description": "Path to get information about"
-                            }
+                        "recursive": {
+                            "type": "boolean",
+                            "default": False,
+                            "description": "Whether to list recursively"
+                        }
+                    },
+                    "required": ["path"]
+                }
+            ),
+            Tool(
+                name="create_directory",
+                description="Create a directory",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "path": {
+                            "type": "string",
+                            "description": "Path to the directory to create"
                         },
-                        "required": ["path"]
-                    }
-                )
-            ]
+                        "parents": {
+                            "type": "boolean",
+                            "default": True,
+                            "description": "Whether to create parent directories"
+                        }
+                    },
+                    "required": ["path"]
+                }
+            ),
+            Tool(
+                name="delete_file",
+                description="Delete a file (with access control)",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "path": {
+                            "type": "string",
+                            "description": "Path to the file to delete"
+                        }
+                    },
+                    "required": ["path"]
+                }
+            ),
+            Tool(
+                name="file_info",
+                description="Get information about a file or directory",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "path": {
+                            "type": "string",
+                            "description": "Path to get information about"
+                        }
+                    },
+                    "required": ["path"]
+                }
+            )
+        ]
+        
+        @self.server.list_tools()
+        async def handle_list_tools() -> List[Tool]:
+            return self._tools
         
         @self.server.call_tool()
         async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             try:
-                if name == "read_file":
-                    result = await self._read_file(arguments)
-                elif name == "write_file":
-                    result = await self._write_file(arguments)
-                elif name == "list_directory":
-                    result = await self._list_directory(arguments)
-                elif name == "create_directory":
-                    result = await self._create_directory(arguments)
-                elif name == "delete_file":
-                    result = await self._delete_file(arguments)
-                elif name == "file_info":
-                    result = await self._file_info(arguments)
-                else:
+                runner = self._runners.get(name)
+                if runner is None:
                     raise ValueError(f"Unknown tool: {name}")
+                result = await self._run_blocking(runner, arguments)
                 
-                return [TextContent(type="text", text=str(result))]
+                return [TextContent(type="text", text=result_to_json(result))]
             except Exception as e:
                 logger.error(f"Tool execution failed: {e}")
                 return [TextContent(type="text", text=f"Error: {str(e)}")]
@@ -219,8 +248,15 @@ class FilesystemServer(BaseMCPModel):
     def _setup_resources(self):
         """Setup filesystem resources."""
         
+        # (expires_at, resources); directories may appear or vanish at runtime
+        self._resources_cache: Optional[tuple] = None
+        
         @self.server.list_resources()
         async def handle_list_resources() -> List[Resource]:
+            now = time.monotonic()
+            if self._resources_cache is not None and now < self._resources_cache[0]:
+                return self._resources_cache[1]
+            
             resources = []
             
             for allowed_path in self.allowed_paths:
@@ -232,9 +268,10 @@ class FilesystemServer(BaseMCPModel):
                         mimeType="inode/directory"
                     ))
             
+            self._resources_cache = (now + RESOURCE_LIST_TTL, resources)
             return resources
     
-    async def _read_file(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _read_file(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Read a file with access control."""
         path = Path(params["path"])
         encoding = params.get("encoding", "utf-8")
@@ -248,31 +285,77 @@ class FilesystemServer(BaseMCPModel):
         if not path.is_file():
             raise IsADirectoryError(f"Path is not a file: {path}")
         
-        try:
-            with open(path, "r", encoding=encoding) as f:
-                content = f.read()
-            
-            return {
-                "path": str(path),
-                "content": content,
-                "size": path.stat().st_size,
-                "encoding": encoding,
-                "status": "success"
-            }
-        except UnicodeDecodeError:
-            # Try binary read for non-text files
-            with open(path, "rb") as f:
-                content = f.read()
-            
-            return {
-                "path": str(path),
-                "content": f"<binary file, {len(content)} bytes>",
-                "size": len(content),
-                "encoding": "binary",
-                "status": "binary_file"
-            }
+        max_bytes = params.get("max_bytes")
+        # bool is an int subclass but never a meaningful size
+        if max_bytes is not None and (
+            not isinstance(max_bytes, int) or isinstance(max_bytes, bool) or max_bytes < 0
+        ):
+            raise ValueError(f"max_bytes must be a non-negative integer, got {max_bytes!r}")
+        
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            # Pseudo-files (e.g. under /proc) report no size and cannot be mapped
+            data = f.read() if size == 0 else None
+            if data is not None:
+                size = len(data)
+            limit = size if max_bytes is None else min(size, max_bytes)
+            truncated = limit < size
+            try:
+                if data is not None:
+                    content = self._decode_text(data[:limit], encoding, final=not truncated)
+                else:
+                    content = self._decode_file(f, limit, encoding, final=not truncated)
+            except UnicodeDecodeError:
+                # Non-text file; report it without reading it a second time
+                return {
+                    "path": str(path),
+                    "content": f"<binary file, {size} bytes>",
+                    "size": size,
+                    "encoding": "binary",
+                    "status": "binary_file"
+                }
+        
+        result = {
+            "path": str(path),
+            "content": content,
+            "size": size,
+            "encoding": encoding,
+            "status": "success"
+        }
+        if max_bytes is not None:
+            result["truncated"] = truncated
+        return result
     
-    async def _write_file(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def _decode_file(f, limit: int, encoding: str, final: bool = True) -> str:
+        """
+        Decode the first ``limit`` bytes of an open binary file.
+        
+        The file is memory-mapped and decoded in place, so the raw bytes are
+        never copied into a separate buffer.
+        """
+        if limit == 0:
+            return ""
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                with view[:limit] as window:
+                    return FilesystemServer._decode_text(window, encoding, final)
+    
+    @staticmethod
+    def _decode_text(data, encoding: str, final: bool = True) -> str:
+        """
+        Decode bytes with text-mode universal newlines (\\r\\n and \\r become \\n).
+        
+        With ``final=False`` a multi-byte character cut off at the end is
+        dropped instead of failing.
+        """
+        decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder(encoding)(), translate=True
+        )
+        return decoder.decode(data, final=final)
+    
+    def _write_file(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Write to a file with access control."""
         path = Path(params["path"])
         content = params["content"]
@@ -284,17 +367,19 @@ class FilesystemServer(BaseMCPModel):
         # Create parent directories if they don't exist
         path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(path, "w", encoding=encoding) as f:
-            f.write(content)
+        # Encode once; the byte count comes from the same buffer
+        data = content.encode(encoding)
+        with open(path, "wb") as f:
+            f.write(data)
         
         return {
             "path": str(path),
-            "bytes_written": len(content.encode(encoding)),
+            "bytes_written": len(data),
             "encoding": encoding,
             "status": "success"
         }
     
-    async def _list_directory(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _list_directory(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """List directory contents."""
         path = Path(params["path"])
         recursive = params.get("recursive", False)
@@ -308,16 +393,7 @@ class FilesystemServer(BaseMCPModel):
         if not path.is_dir():
             raise NotADirectoryError(f"Path is not a directory: {path}")
         
-        items = []
-        
-        if recursive:
-            for item in path.rglob("*"):
-                if self._is_path_allowed(item, write_access=False):
-                    items.append(self._get_file_info(item))
-        else:
-            for item in path.iterdir():
-                if self._is_path_allowed(item, write_access=False):
-                    items.append(self._get_file_info(item))
+        items = self._scan_directory(path, recursive)
         
         return {
             "path": str(path),
@@ -327,7 +403,7 @@ class FilesystemServer(BaseMCPModel):
             "status": "success"
         }
     
-    async def _create_directory(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _create_directory(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create a directory."""
         path = Path(params["path"])
         parents = params.get("parents", True)
@@ -343,7 +419,7 @@ class FilesystemServer(BaseMCPModel):
             "status": "success"
         }
     
-    async def _delete_file(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _delete_file(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Delete a file."""
         path = Path(params["path"])
         
@@ -366,7 +442,7 @@ class FilesystemServer(BaseMCPModel):
             "status": "success"
         }
     
-    async def _file_info(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _file_info(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Get file information."""
         path = Path(params["path"])
         
@@ -378,27 +454,91 @@ class FilesystemServer(BaseMCPModel):
         
         return self._get_file_info(path)
     
+    def _scan_directory(self, path: Path, recursive: bool) -> List[Dict[str, Any]]:
+        """
+        Describe the entries of an allowed directory, optionally recursively.
+        
+        Uses os.scandir so entry types come from the directory listing and
+        no Path object is built per entry. The root is resolved once; like
+        rglob, the walk does not descend into symlinked directories, so
+        only symlinks need resolving to stay inside the allowed roots.
+        """
+        items = []
+        stack = [(os.fspath(path), str(path.resolve()))]
+        
+        while stack:
+            directory, resolved_directory = stack.pop()
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                if directory == os.fspath(path):
+                    raise
+                continue  # Unreadable subdirectory, skip it as rglob does
+            
+            with entries:
+                for entry in entries:
+                    if entry.is_symlink():
+                        if self._is_path_allowed(Path(entry.path), write_access=False):
+                            items.append(self._describe_entry(entry.path, entry.name, entry.stat))
+                        continue
+                    
+                    resolved = os.path.join(resolved_directory, entry.name)
+                    items.append(
+                        self._describe_entry(entry.path, entry.name, entry.stat, resolved)
+                    )
+                    if recursive and entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, resolved))
+        
+        return items
+    
     def _get_file_info(self, path: Path) -> Dict[str, Any]:
         """Get detailed information about a file or directory."""
+        return self._describe_entry(str(path), path.name, path.stat)
+    
+    def _describe_entry(
+        self,
+        path: str,
+        name: str,
+        stat_func: Callable[[], os.stat_result],
+        resolved: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Build the info dict for one file or directory.
+        
+        Args:
+            path: Path to describe
+            name: Final path component
+            stat_func: Returns the path's stat result (following symlinks);
+                DirEntry.stat caches it for the entry
+            resolved: The path already resolved, if known, to skip resolving
+                it again for the write check
+        """
         try:
-            stat_info = path.stat()
+            stat_info = stat_func()
+            if os.access(path, os.W_OK):
+                writable = (
+                    self._is_path_allowed(Path(path), write_access=True) if resolved is None
+                    else self._is_resolved_allowed(resolved, write_access=True)
+                )
+            else:
+                writable = False
             
             return {
-                "path": str(path),
-                "name": path.name,
-                "type": "directory" if path.is_dir() else "file",
+                "path": path,
+                "name": name,
+                "type": "directory" if stat.S_ISDIR(stat_info.st_mode) else "file",
                 "size": stat_info.st_size,
                 "modified": stat_info.st_mtime,
                 "permissions": stat.filemode(stat_info.st_mode),
                 "owner_uid": stat_info.st_uid,
                 "group_gid": stat_info.st_gid,
                 "readable": os.access(path, os.R_OK),
-                "writable": os.access(path, os.W_OK) and self._is_path_allowed(path, write_access=True),
+                "writable": writable,
                 "executable": os.access(path, os.X_OK)
             }
         except OSError as e:
             return {
-                "path": str(path),
+                "path": path,
                 "error": str(e),
                 "accessible": False
             }
@@ -414,6 +554,7 @@ async def main():
     server_instance = FilesystemServer(allowed_paths)
     
     async with stdio_server() as (read_stream, write_stream):
+        notify_ready()
         await server_instance.server.run(
             read_stream,
             write_stream,
@@ -429,4 +570,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run_server(main())
\ No newline at end of file
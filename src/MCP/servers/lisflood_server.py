@@ -6,7 +6,6 @@ This server provides Model Context Protocol (MCP) interface for LISFLOOD
 hydrological modeling tools.
 """
 
-import asyncio
 import logging
 import os
 from pathlib import Path
@@ -17,8 +16,9 @@ from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
 from mcp.types import Resource, Tool, TextContent
 
-from ..core.base_model import BaseMCPModel
+from ..core.base_model import BaseMCPModel, notify_ready, run_server
 from ..core.environment_manager import environment_manager
+from .common import call_runner
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -152,26 +152,18 @@ class LisfloodServer(BaseMCPModel):
                 )
             ]
         
+        # Tool name -> coroutine running it
+        self._runners = {
+            "lisflood_simulation": self._run_simulation,
+            "lisflood_forecast": self._run_forecast,
+            "lisflood_calibration": self._run_calibration,
+            "lisflood_water_balance": self._run_water_balance
+        }
+        
         @self.server.call_tool()
         async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             """Handle tool execution."""
-            try:
-                if name == "lisflood_simulation":
-                    result = await self._run_simulation(arguments)
-                elif name == "lisflood_forecast":
-                    result = await self._run_forecast(arguments)
-                elif name == "lisflood_calibration":
-                    result = await self._run_calibration(arguments)
-                elif name == "lisflood_water_balance":
-                    result = await self._run_water_balance(arguments)
-                else:
-                    raise ValueError(f"Unknown tool: {name}")
-                
-                return [TextContent(type="text", text=str(result))]
-                
-            except Exception as e:
-                logger.error(f"Tool execution failed: {e}")
-                return [TextContent(type="text", text=f"Error: {str(e)}")]
+            return await call_runner(self._runners, name, arguments)
     
     def _setup_resources(self):
         """Setup LISFLOOD resources."""
@@ -368,9 +360,11 @@ class LisfloodServer(BaseMCPModel):
 
 async def main():
     """Run the LISFLOOD MCP server."""
+    await environment_manager.start()
     server_instance = LisfloodServer()
     
     async with stdio_server() as (read_stream, write_stream):
+        notify_ready()
         await server_instance.server.run(
             read_stream,
             write_stream,
@@ -386,4 +380,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run_server(main())
\ No newline at end of file
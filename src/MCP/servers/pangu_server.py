@@ -6,7 +6,6 @@ This server provides Model Context Protocol (MCP) interface for Pangu Weather
 AI-based weather prediction model.
 """
 
-import asyncio
 import logging
 import os
 from typing import Any, Dict, List
@@ -16,7 +15,7 @@ from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
 from mcp.types import Resource, Tool, TextContent
 
-from ..core.base_model import BaseMCPModel
+from ..core.base_model import BaseMCPModel, notify_ready, result_to_json, run_server
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -81,7 +80,7 @@ class PanguServer(BaseMCPModel):
                 else:
                     raise ValueError(f"Unknown tool: {name}")
                 
-                return [TextContent(type="text", text=str(result))]
+                return [TextContent(type="text", text=result_to_json(result))]
             except Exception as e:
                 logger.error(f"Tool execution failed: {e}")
                 return [TextContent(type="text", text=f"Error: {str(e)}")]
@@ -132,6 +131,7 @@ async def main():
     server_instance = PanguServer()
     
     async with stdio_server() as (read_stream, write_stream):
+        notify_ready()
         await server_instance.server.run(
             read_stream,
             write_stream,
@@ -147,4 +147,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run_server(main())
\ No newline at end of file
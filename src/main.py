@@ -52,6 +52,13 @@ except Exception as e:
 from src.agent.graph import process_emergency_event, get_system_health
 from src.core.config import config
 
+# Prefer the libuv-based event loop when it is installed
+try:
+    import uvloop  # noqa: F401
+    EVENT_LOOP = "uvloop"
+except ImportError:
+    EVENT_LOOP = "asyncio"
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -182,7 +189,8 @@ def main():
         port=2024,
         reload=True,
         log_level="info",
-        reload_dirs=["src"]
+        reload_dirs=["src"],
+        loop=EVENT_LOOP
     )
 
 
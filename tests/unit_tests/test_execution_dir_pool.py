@@ -0,0 +1,91 @@
+import subprocess
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from src.MCP.adapters.climada_adapter import ClimadaAdapter
+from src.MCP.core.base_model import ExecutionDirPool, ModelStatus
+
+
+@pytest.fixture
+def scratch(tmp_path, monkeypatch) -> Path:
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    return tmp_path
+
+
+@pytest.mark.anyio
+async def test_released_directory_is_emptied_and_renamed_for_next_execution(scratch) -> None:
+    pool = ExecutionDirPool(prefix="model_")
+
+    first = await pool.acquire("exec1")
+    assert first.name.startswith("model_exec1_")
+    (first / "out.csv").write_text("1,2")
+    (first / "sub").mkdir()
+    (first / "sub" / "nested.txt").write_text("x")
+    await pool.release(first)
+
+    second = await pool.acquire("exec2")
+    assert second.name.startswith("model_exec2_")
+    assert second.parent == first.parent
+    assert not first.exists()
+    assert list(second.iterdir()) == []
+
+
+@pytest.mark.anyio
+async def test_release_beyond_max_idle_removes_directory(scratch) -> None:
+    pool = ExecutionDirPool(prefix="model_", max_idle=1)
+
+    kept = await pool.acquire("a")
+    dropped = await pool.acquire("b")
+    await pool.release(kept)
+    await pool.release(dropped)
+
+    assert kept.exists()
+    assert not dropped.exists()
+
+
+def _adapter_writing(monkeypatch, *names: str) -> ClimadaAdapter:
+    """A CLIMADA adapter whose script run just creates ``names`` in its directory."""
+    adapter = ClimadaAdapter(climada_path=Path("/nonexistent"))
+
+    async def fake_run(command, working_dir=None, timeout=3600, max_output_bytes=None):
+        for name in names:
+            (working_dir / name).write_text("{}")
+        return subprocess.CompletedProcess(command, 0, b"", b"")
+
+    monkeypatch.setattr(adapter, "run_conda_command", fake_run)
+    return adapter
+
+
+@pytest.mark.anyio
+async def test_directory_without_outputs_goes_back_to_pool(scratch, monkeypatch) -> None:
+    # The generated script and results.json are the adapter's own files
+    adapter = _adapter_writing(monkeypatch, "results.json")
+    tool_name = adapter.available_tools[0]
+
+    result = await adapter.execute_tool(tool_name, {}, execution_id="run1")
+
+    assert result.status == ModelStatus.COMPLETED
+    assert result.files == []
+    assert result.working_directory is None
+    assert len(adapter._dir_pool._idle) == 1
+    assert list(adapter._dir_pool._idle[0].iterdir()) == []
+
+
+@pytest.mark.anyio
+async def test_directory_with_outputs_belongs_to_caller(scratch, monkeypatch) -> None:
+    adapter = _adapter_writing(monkeypatch, "results.json", "impact.csv")
+    tool_name = adapter.available_tools[0]
+
+    result = await adapter.execute_tool(tool_name, {}, execution_id="run2")
+
+    exec_dir = Path(result.working_directory)
+    assert [Path(f).name for f in result.files] == ["impact.csv"]
+    assert exec_dir.name.startswith("climada_run2_")
+    assert (exec_dir / "impact.csv").exists()
+    assert adapter._dir_pool._idle == []
+
+    # A later execution never reuses the caller's directory
+    await adapter.execute_tool(tool_name, {}, execution_id="run3")
+    assert (exec_dir / "impact.csv").exists()
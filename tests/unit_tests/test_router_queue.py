@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+from src.MCP.core.base_model import ModelStatus
+from src.MCP.core.router import MCPRouter
+
+
+def _router(max_concurrent: int = 1) -> MCPRouter:
+    router = MCPRouter()
+    router._max_concurrent_executions = max_concurrent
+    # The queue only checks that the model is still registered
+    router._models["model"] = object()
+    return router
+
+
+def _queue(router: MCPRouter, execution_id: str, priority: int = 0) -> asyncio.Task:
+    return asyncio.ensure_future(
+        router._acquire_slot("tool", {}, execution_id, priority, "model")
+    )
+
+
+async def _positions(router: MCPRouter, *execution_ids: str):
+    return [
+        (await router.get_execution_status(execution_id))["position"]
+        for execution_id in execution_ids
+    ]
+
+
+@pytest.mark.anyio
+async def test_released_slot_goes_to_highest_priority_then_fifo() -> None:
+    router = _router()
+    assert await router._acquire_slot("tool", {}, "running", 0, "model") is None
+
+    low1 = _queue(router, "low1")
+    high = _queue(router, "high", priority=5)
+    low2 = _queue(router, "low2")
+    await asyncio.sleep(0)
+    assert await _positions(router, "high", "low1", "low2") == [0, 1, 2]
+
+    router._release_slot()
+    assert await high is None
+    assert not low1.done() and not low2.done()
+    assert await _positions(router, "low1", "low2") == [0, 1]
+
+    router._release_slot()
+    assert await low1 is None
+    router._release_slot()
+    assert await low2 is None
+
+    # Nobody is waiting any more, so the slot returns to the semaphore
+    router._release_slot()
+    assert not router._slots.locked()
+
+
+@pytest.mark.anyio
+async def test_cancelled_waiter_is_skipped_on_hand_off() -> None:
+    router = _router()
+    await router._acquire_slot("tool", {}, "running", 0, "model")
+    first = _queue(router, "first")
+    second = _queue(router, "second")
+    await asyncio.sleep(0)
+
+    assert await router.cancel_execution("first")
+    cancelled = await first
+    assert cancelled.status == ModelStatus.FAILED
+    assert cancelled.error == "Execution cancelled by user"
+    assert await _positions(router, "second") == [0]
+
+    router._release_slot()
+    assert await second is None
+    assert await router.get_execution_status("first") is None
+
+
+@pytest.mark.anyio
+async def test_task_cancelled_after_hand_off_passes_slot_on() -> None:
+    router = _router()
+    await router._acquire_slot("tool", {}, "running", 0, "model")
+    first = _queue(router, "first")
+    second = _queue(router, "second")
+    await asyncio.sleep(0)
+
+    # The slot is handed to "first" but its caller is cancelled before resuming
+    router._release_slot()
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    assert await asyncio.wait_for(second, timeout=1) is None
+
+
+@pytest.mark.anyio
+async def test_waiter_for_removed_model_gets_error_result() -> None:
+    router = _router()
+    await router._acquire_slot("tool", {}, "running", 0, "model")
+    waiting = _queue(router, "waiting")
+    await asyncio.sleep(0)
+
+    router.unregister_model("model")
+    router._release_slot()
+
+    result = await waiting
+    assert result.status == ModelStatus.FAILED
+    assert result.error == "Model 'model' no longer available"
+    assert not router._slots.locked()
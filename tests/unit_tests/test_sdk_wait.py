@@ -0,0 +1,113 @@
+import json
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+import pytest
+
+from src.MCP.sdk import MCPClient, MCPHTTPError
+
+
+class _Context:
+    def __init__(self, value: Any):
+        self.value = value
+
+    async def __aenter__(self):
+        return self.value
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _Response:
+    def __init__(self, status: int, body: Dict[str, Any]):
+        self.status = status
+        self._body = json.dumps(body).encode()
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def text(self) -> str:
+        return self._body.decode()
+
+
+class _WebSocket:
+    def __init__(self, message: aiohttp.WSMessage):
+        self.message = message
+
+    async def receive(self) -> aiohttp.WSMessage:
+        return self.message
+
+
+class _Session:
+    """Serves one pushed WebSocket message (or none) and a list of polled responses."""
+
+    closed = False
+
+    def __init__(self, pushed: Optional[aiohttp.WSMessage], polled: List[_Response]):
+        self.pushed = pushed
+        self.polled = polled
+        self.poll_count = 0
+
+    def ws_connect(self, url: str) -> _Context:
+        if self.pushed is None:
+            raise aiohttp.ClientConnectionError("WebSocket unavailable")
+        return _Context(_WebSocket(self.pushed))
+
+    def request(self, method: str, url: str, **kwargs) -> _Context:
+        self.poll_count += 1
+        return _Context(self.polled.pop(0))
+
+
+def _text(body: Dict[str, Any]) -> aiohttp.WSMessage:
+    return aiohttp.WSMessage(aiohttp.WSMsgType.TEXT, json.dumps(body), None)
+
+
+def _client(session: _Session) -> MCPClient:
+    client = MCPClient("http://mcp.test")
+    client.session = session
+    return client
+
+
+FAILED = {"execution_id": "e1", "status": "failed", "error": "model crashed"}
+RUNNING = {"execution_id": "e1", "status": "running"}
+NOT_FOUND = {"error": "Execution 'e1' not found"}
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("final", [FAILED, dict(FAILED, status="completed", result={"loss": 1.5})])
+async def test_pushed_and_polled_statuses_are_returned_alike(final) -> None:
+    pushed = _client(_Session(_text(final), []))
+    polled = _client(_Session(None, [_Response(200, RUNNING), _Response(200, final)]))
+
+    from_push = await pushed.wait_for_completion("e1", poll_interval=0)
+    from_poll = await polled.wait_for_completion("e1", poll_interval=0)
+
+    assert from_push == from_poll == final
+    assert pushed.session.poll_count == 0
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "session",
+    [
+        _Session(_text(NOT_FOUND), []),
+        _Session(None, [_Response(404, {"detail": "Execution not found"})]),
+    ],
+    ids=["push", "poll"],
+)
+async def test_unknown_execution_raises_not_found(session) -> None:
+    with pytest.raises(MCPHTTPError) as excinfo:
+        await _client(session).wait_for_completion("e1", poll_interval=0)
+
+    assert excinfo.value.status == 404
+
+
+@pytest.mark.anyio
+async def test_non_text_frame_falls_back_to_polling() -> None:
+    closed = aiohttp.WSMessage(aiohttp.WSMsgType.CLOSE, 1011, None)
+    session = _Session(closed, [_Response(200, FAILED)])
+
+    status = await _client(session).wait_for_completion("e1", poll_interval=0)
+
+    assert status == FAILED
+    assert session.poll_count == 1
@@ -0,0 +1,67 @@
+import pytest
+
+from src.MCP.core.tool_registry import ToolRegistry
+
+
+def flood_simulation(catchment: str, days: int = 1):
+    """Run a river flood simulation."""
+
+
+def impact_assessment(region: str):
+    """Estimate hazard impacts on exposed assets."""
+
+
+def abcd_tool():
+    """Unrelated."""
+
+
+@pytest.fixture
+def registry() -> ToolRegistry:
+    registry = ToolRegistry()
+    registry.register_tool("flood_simulation", flood_simulation, "lisflood", "simulation", tags=["Hydrology"])
+    registry.register_tool("impact_assessment", impact_assessment, "climada", "analysis", tags=["risk"])
+    registry.register_tool("abcd", abcd_tool, "other", "misc", tags=["bcde"])
+    return registry
+
+
+def _names(registry: ToolRegistry, query: str):
+    return [tool.name for tool in registry.search_tools(query)]
+
+
+def _substring_reference(registry: ToolRegistry, query: str):
+    query = query.lower()
+    return [
+        tool.name for tool in registry.list_tools()
+        if query in tool.name.lower()
+        or query in tool.description.lower()
+        or any(query in tag.lower() for tag in tool.tags)
+    ]
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["flood", "FLOOD", "river flood", "hydro", "risk", "im", "a", "", "assets.", "xyz", "abcde", "bcde"],
+)
+def test_search_matches_case_insensitive_substrings(registry, query) -> None:
+    assert _names(registry, query) == _substring_reference(registry, query)
+
+
+def test_query_must_appear_within_one_field(registry) -> None:
+    # Every trigram of "abcde" is indexed for the tool, but only across name and tag
+    assert _names(registry, "abcde") == []
+    assert _names(registry, "bcde") == ["abcd"]
+
+
+def test_results_keep_registration_order_across_re_registration(registry) -> None:
+    assert _names(registry, "s") == ["flood_simulation", "impact_assessment"]
+
+    registry.register_tool("flood_simulation", flood_simulation, "lisflood", "simulation", description="Flood run")
+    assert _names(registry, "s") == ["flood_simulation", "impact_assessment"]
+    assert _names(registry, "river") == []
+
+
+def test_unregistered_tool_is_not_found(registry) -> None:
+    assert registry.unregister_tool("impact_assessment")
+
+    assert _names(registry, "impact") == []
+    assert _names(registry, "hazard") == []